@@ -115,8 +115,13 @@ async def fetch_data_for_range(
     return all_data
 
 
-async def fetch_and_save_historical_data(params_obj: Dict[str, Any]) -> None:
-    """Fetch and save historical data for all timeframes"""
+async def fetch_and_save_historical_data(params_obj: Dict[str, Any]) -> bool:
+    """
+    Fetch and save historical data for all timeframes
+    
+    Returns:
+        True if every timeframe was processed, False if an error occurred
+    """
     symbol: str = normalize_symbol_for_api(params_obj["symbol"])
     timeframes: Union[Timeframe, List[Timeframe]] = params_obj["timeframe"]
     start_date: str = params_obj["start_date"]
@@ -168,7 +173,10 @@ async def fetch_and_save_historical_data(params_obj: Dict[str, Any]) -> None:
             await task
             print()
 
+        return True
+
     except Exception as e:
         print(f"Error processing {symbol}: {str(e)}")
+        return False
     finally:
         await exchange.close()
@@ -59,8 +59,11 @@ async def process_timeframe(
         start_date = start_datetime.strftime("%Y-%m-%d")
 
     if os.path.exists(filepath):
-        existing_data = pd.read_csv(filepath)
-        existing_data["Date"] = pd.to_datetime(existing_data["Date"])
+        # Arrow's multi-threaded reader parses Date in the same pass
+        try:
+            existing_data = pd.read_csv(filepath, engine="pyarrow", parse_dates=["Date"])
+        except ImportError:
+            existing_data = pd.read_csv(filepath, engine="c", parse_dates=["Date"])
         print(f"Existing data found in {filepath}")
 
         earliest_date: pd.Timestamp = existing_data["Date"].min()
@@ -97,10 +100,10 @@ async def process_timeframe(
 
     all_new_data: List[List[Union[int, float]]] = []
 
+    # Import here to avoid circular dependency (once, not per date range)
+    from .fetcher import fetch_data_for_range
+
     for date_range in ranges_to_fetch:
-        # Import here to avoid circular dependency
-        from .fetcher import fetch_data_for_range
-        
         chunk_data = await fetch_data_for_range(
             exchange,
             symbol,
@@ -123,8 +126,15 @@ async def process_timeframe(
     new_df["Date"] = pd.to_datetime(new_df["Date"], unit="ms")
 
     if existing_data is not None:
-        combined_df: pd.DataFrame = pd.concat([existing_data, new_df])
-        combined_df = combined_df.drop_duplicates(subset=["Date"]).sort_values("Date")
+        combined_df: pd.DataFrame = pd.concat([existing_data, new_df], ignore_index=True)
+        
+        # Appending newer candles keeps the file sorted; only sort/dedupe when needed.
+        # New rows come last, so keep="last" prefers the freshly scraped candle.
+        duplicated = combined_df["Date"].duplicated(keep="last")
+        if duplicated.any():
+            combined_df = combined_df[~duplicated]
+        if not combined_df["Date"].is_monotonic_increasing:
+            combined_df = combined_df.sort_values("Date", kind="stable")
         combined_df.to_csv(filepath, index=False)
         print(
             f"{SUCCESS_COLOR}Updated: {symbol} [{timeframe_value}] {start_date} to {end_date}{RESET_COLOR}"
@@ -52,19 +52,23 @@ def _simulate_crash_dca(
     crash_buys = 0
     regular_buys = 0
     
+    # Pull columns out once; iloc per bar builds a whole row Series
+    dates = data.index.tolist()
+    closes = data['Close'].tolist()
+    
     for i in range(len(data)):
-        current_date = data.index[i]
-        current_price = data.iloc[i]['Close']
+        current_date = dates[i]
+        current_price = closes[i]
         
         # Calculate drops
         daily_drop = 0
         if i > 0:
-            prev_close = data.iloc[i-1]['Close']
+            prev_close = closes[i-1]
             daily_drop = (prev_close - current_price) / prev_close
         
         weekly_drop = 0
         if i >= 7:
-            week_ago_close = data.iloc[i-7]['Close']
+            week_ago_close = closes[i-7]
             weekly_drop = (week_ago_close - current_price) / week_ago_close
         
         # Check conditions
@@ -95,7 +99,7 @@ def _simulate_crash_dca(
             total_invested += buy_amount
     
     # Calculate final value
-    final_price = data.iloc[-1]['Close']
+    final_price = closes[-1]
     final_value = total_units * final_price
     total_return = final_value - total_invested
     return_pct = (total_return / total_invested * 100) if total_invested > 0 else 0
@@ -120,11 +124,13 @@ def _simulate_regular_dca(
     monthly_interval_days: int
 ) -> Dict[str, Any]:
     """Simulate regular DCA with same total investment"""
+    dates = data.index.tolist()
+    closes = data['Close'].tolist()
+    
     # Count how many monthly buys we'll have
     monthly_buy_count = 0
     last_check = None
-    for i in range(len(data)):
-        current_date = data.index[i]
+    for current_date in dates:
         should_buy = False
         if last_check is None:
             should_buy = True
@@ -143,10 +149,7 @@ def _simulate_regular_dca(
     total_units = 0
     last_buy = None
     
-    for i in range(len(data)):
-        current_date = data.index[i]
-        current_price = data.iloc[i]['Close']
-        
+    for current_date, current_price in zip(dates, closes):
         should_buy = False
         if last_buy is None:
             should_buy = True
@@ -160,7 +163,7 @@ def _simulate_regular_dca(
             total_invested += amount_per_month
             last_buy = current_date
     
-    final_price = data.iloc[-1]['Close']
+    final_price = closes[-1]
     final_value = total_units * final_price
     total_return = final_value - total_invested
     return_pct = (total_return / total_invested * 100) if total_invested > 0 else 0
@@ -3,6 +3,10 @@ RSI + MACD Combo Strategy - Indicator Calculations
 """
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Bars on each side of a pivot candidate
+PIVOT_LOOKAROUND = 5
 
 
 def calculate_rsi(close_series: pd.Series, length: int) -> np.ndarray:
@@ -38,27 +42,29 @@ def calculate_macd(close_series: pd.Series, fast: int, slow: int, signal: int) -
     return macd_line.fillna(0).values, signal_line.fillna(0).values, histogram.fillna(0).values
 
 
-def calculate_bull_pivots(rsi_values: np.ndarray) -> np.ndarray:
-    """Calculate bullish pivot lows for RSI"""
-    pivots = np.full(len(rsi_values), np.nan)
+def _window_pivots(rsi_values: np.ndarray, is_pivot_window) -> np.ndarray:
+    """
+    Mark RSI values that are the extremum of their centered 11-bar window
     
-    for i in range(5, len(rsi_values) - 5):
-        # Check if current point is a pivot low
-        window = rsi_values[i-5:i+6]
-        if rsi_values[i] == np.min(window):
-            pivots[i] = rsi_values[i]
+    Windows are built once as strided views instead of slicing per bar.
+    """
+    pivots = np.full(len(rsi_values), np.nan)
+    if len(rsi_values) < 2 * PIVOT_LOOKAROUND + 1:
+        return pivots
     
+    rsi_values = np.asarray(rsi_values, dtype=float)
+    windows = sliding_window_view(rsi_values, 2 * PIVOT_LOOKAROUND + 1)
+    centers = rsi_values[PIVOT_LOOKAROUND:-PIVOT_LOOKAROUND]
+    is_pivot = centers == is_pivot_window(windows, axis=1)
+    pivots[PIVOT_LOOKAROUND:-PIVOT_LOOKAROUND][is_pivot] = centers[is_pivot]
     return pivots
 
 
+def calculate_bull_pivots(rsi_values: np.ndarray) -> np.ndarray:
+    """Calculate bullish pivot lows for RSI"""
+    return _window_pivots(rsi_values, np.min)
+
+
 def calculate_bear_pivots(rsi_values: np.ndarray) -> np.ndarray:
     """Calculate bearish pivot highs for RSI"""
-    pivots = np.full(len(rsi_values), np.nan)
-    
-    for i in range(5, len(rsi_values) - 5):
-        # Check if current point is a pivot high
-        window = rsi_values[i-5:i+6]
-        if rsi_values[i] == np.max(window):
-            pivots[i] = rsi_values[i]
-    
-    return pivots
+    return _window_pivots(rsi_values, np.max)
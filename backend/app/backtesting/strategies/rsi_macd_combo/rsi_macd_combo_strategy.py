@@ -70,13 +70,16 @@ class RSIMACDComboStrategy(BaseBacktestStrategy):
         if scripts_dir not in sys.path:
             sys.path.insert(0, scripts_dir)
         
-        from drawing_helpers import create_vertical_line
+        from drawing_helpers import create_vertical_line, to_utc_isoformat_many
         
         drawings = []
         
-        for i, signal in enumerate(self._trade_signals):
+        # Format every signal time in one pass
+        signals = self._trade_signals
+        signal_times = to_utc_isoformat_many([signal['time'] for signal in signals])
+        
+        for i, (signal, signal_time) in enumerate(zip(signals, signal_times)):
             signal_type = signal.get('type')
-            signal_time = signal['time'].tz_localize("UTC").isoformat()
             price = signal['price']
             
             # Create vertical line for signals
@@ -2,11 +2,30 @@
 Simple MA Cross Strategy - Strategy Class Implementation
 """
 from typing import Dict, Any, List
+import numpy as np
 import pandas as pd
-from backtesting.lib import crossover
 from backtesting import Strategy
 
 
+def compute_cross_signals(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """
+    Precompute MA crossover signals for every bar
+    
+    Matches backtesting.lib.crossover evaluated at each bar: NaN warm-up
+    values never cross.
+    
+    Returns:
+        int8 array with 1 where fast crosses above slow, -1 where it
+        crosses below, 0 otherwise
+    """
+    signals = np.zeros(len(fast), dtype=np.int8)
+    prev_fast, prev_slow = fast[:-1], slow[:-1]
+    curr_fast, curr_slow = fast[1:], slow[1:]
+    signals[1:][(prev_fast < prev_slow) & (curr_fast > curr_slow)] = 1
+    signals[1:][(prev_slow < prev_fast) & (curr_slow > curr_fast)] = -1
+    return signals
+
+
 def create_strategy_class(
     params: Dict[str, Any],
     balance_history_list: List[Dict[str, Any]],
@@ -39,6 +58,10 @@ def create_strategy_class(
             close_series = pd.Series(self.data.Close)
             self.fast = self.I(close_series.rolling(self.fast_ma).mean)
             self.slow = self.I(close_series.rolling(self.slow_ma).mean)
+            # Indicators are fully known up front, so cross detection is too
+            self.signals = compute_cross_signals(
+                np.asarray(self.fast, dtype=float), np.asarray(self.slow, dtype=float)
+            )
 
         def next(self):
             """Trading logic"""
@@ -54,9 +77,10 @@ def create_strategy_class(
                 })
             
             entry_price = current_price
+            signal = self.signals[len(self.data) - 1]
 
             # Long position when fast crosses above slow
-            if crossover(list(self.fast), list(self.slow)) and not self.position:
+            if signal == 1 and not self.position:
                 # Calculate stop loss and take profit levels for long
                 stop_loss = entry_price * (1 - self.stop_loss_pct)
                 take_profit = entry_price * (1 + (self.stop_loss_pct * self.risk_reward))
@@ -65,7 +89,7 @@ def create_strategy_class(
                 self.buy(sl=stop_loss, tp=take_profit)
 
             # Short position when fast crosses below slow
-            elif crossover(list(self.slow), list(self.fast)) and not self.position:
+            elif signal == -1 and not self.position:
                 # Calculate stop loss and take profit levels for short
                 stop_loss = entry_price * (1 + self.stop_loss_pct)
                 take_profit = entry_price * (1 - (self.stop_loss_pct * self.risk_reward))
@@ -47,25 +47,26 @@ class SmartMoneySimpleTestStrategy(BaseBacktestStrategy):
         if scripts_dir not in sys.path:
             sys.path.insert(0, scripts_dir)
         
-        from drawing_helpers import create_horizontal_line, create_rectangle
+        from drawing_helpers import create_horizontal_line, create_rectangle, to_utc_isoformat_many
         
         drawings = []
         
-        for i, level in enumerate(self._trade_signals):
+        # Format every level's start/end time in one pass
+        levels = self._trade_signals
+        start_times = to_utc_isoformat_many([level['time'] for level in levels])
+        end_times = to_utc_isoformat_many([level.get('end_time') for level in levels])
+        
+        for i, (level, level_time, level_end_time) in enumerate(zip(levels, start_times, end_times)):
             level_type = level.get('type')
-            level_time = level['time'].tz_localize("UTC").isoformat()
             price = level['price']
             
             # Determine end time
-            if level.get('end_time') is not None:
-                end_time = level['end_time'].tz_localize("UTC").isoformat()
-            else:
-                end_time = "relative"
+            end_time = level_end_time if level_end_time is not None else "relative"
             
             # Swing highs/lows
             if level_type in ['swing_high', 'swing_low']:
                 line_color = "#00C851" if level_type == 'swing_high' else "#FF4444"
-                line_style = "dashed" if level.get('end_time') is not None else "solid"
+                line_style = "dashed" if level_end_time is not None else "solid"
                 
                 drawing = create_horizontal_line(
                     drawing_id=f"smc_{level_type}_{i}",
@@ -75,6 +75,14 @@ def create_strategy_class(
                 )
             else:
                 self.order_blocks = []
+            
+            # Group detections by bar index so next() only sees the current bar's
+            self.fvgs_by_index = {}
+            for fvg in self.fvgs:
+                self.fvgs_by_index.setdefault(fvg['index'], []).append(fvg)
+            self.order_blocks_by_index = {}
+            for ob in self.order_blocks:
+                self.order_blocks_by_index.setdefault(ob['index'], []).append(ob)
         
         def next(self):
             """Process each bar and store significant levels - NO TRADING"""
@@ -118,8 +126,8 @@ def create_strategy_class(
             
             # Check for new FVGs
             if self.show_fvgs and hasattr(self, 'fvgs'):
-                for fvg in self.fvgs:
-                    if fvg['index'] == current_idx and not fvg.get('added_to_levels', False):
+                for fvg in self.fvgs_by_index.get(current_idx, ()):
+                    if not fvg.get('added_to_levels', False):
                         # Calculate start time from first candle of pattern
                         start_candle_index = fvg['index'] - 2
                         start_time = self.data.index[start_candle_index]
@@ -136,8 +144,8 @@ def create_strategy_class(
             
             # Check for new Order Blocks
             if self.show_order_blocks and hasattr(self, 'order_blocks'):
-                for ob in self.order_blocks:
-                    if ob['index'] == current_idx and not ob.get('added_to_levels', False):
+                for ob in self.order_blocks_by_index.get(current_idx, ()):
+                    if not ob.get('added_to_levels', False):
                         level = self.level_manager.add_order_block(ob)
                         SmartMoneyHighsLowsStrategy._collected_levels.append(level)
                         detected_levels_list.append(level)
@@ -33,6 +33,11 @@ class Settings:
     # Socket.IO Settings
     SOCKET_CORS_ORIGINS: str = os.getenv("SOCKET_CORS_ORIGINS", "*")
 
+    # Exchange Settings
+    # Quote currency to restrict ticker fetches to; empty (default) fetches
+    # every market. When set, tickers for other quotes are never fetched.
+    TICKER_QUOTE_CURRENCY: str = os.getenv("TICKER_QUOTE_CURRENCY", "")
+
 
 # Create settings instance
 settings = Settings()
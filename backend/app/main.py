@@ -6,6 +6,7 @@ from app.core.cors import setup_cors
 from app.api.v1.api import api_router
 from app.core.socket_instance import sio
 from app.core.socket_manager import bybit_ws_manager
+from app.services.exchange_service import exchange_service
 from app.db.database import engine
 from app.models.undelivered_drawings import Base
 
@@ -52,3 +53,9 @@ async def start_bybit_ws():
 @fastapi_app.on_event("shutdown")
 async def shutdown_bybit_ws():
     await bybit_ws_manager.cleanup()
+
+
+# Close the async exchange session on shutdown
+@fastapi_app.on_event("shutdown")
+async def shutdown_exchange():
+    await exchange_service.close()
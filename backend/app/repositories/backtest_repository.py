@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.backtest_results import BacktestResult
 from app.models.backtest_symbol import BacktestSymbol
@@ -57,32 +58,37 @@ class BacktestRepository:
         return backtest
 
     def _create_trades(self, backtest_id: int, trades_data: list) -> None:
-        """Create trade records for a backtest"""
-        for trade_data in trades_data:
-            trade = Trade(
-                backtest_id=backtest_id,
-                symbol=trade_data.get("symbol"),
-                entry_time=(
+        """Create trade records for a backtest in one bulk INSERT"""
+        trade_rows = [
+            {
+                "backtest_id": backtest_id,
+                "symbol": trade_data.get("symbol"),
+                "entry_time": (
                     datetime.fromisoformat(trade_data.get("entry_time"))
                     if trade_data.get("entry_time")
                     else None
                 ),
-                exit_time=(
+                "exit_time": (
                     datetime.fromisoformat(trade_data.get("exit_time"))
                     if trade_data.get("exit_time")
                     else None
                 ),
-                entry_price=trade_data.get("entry_price"),
-                exit_price=trade_data.get("exit_price"),
-                take_profit=trade_data.get("take_profit"),
-                stop_loss=trade_data.get("stop_loss"),
-                pnl=trade_data.get("pnl"),
-                size=trade_data.get("size"),
-                trade_type=trade_data.get("type"),
-                pnl_percentage=trade_data.get("pnl_percentage"),
-                exit_reason=trade_data.get("exit_reason"),
-            )
-            self.db.add(trade)
+                "entry_price": trade_data.get("entry_price"),
+                "exit_price": trade_data.get("exit_price"),
+                "take_profit": trade_data.get("take_profit"),
+                "stop_loss": trade_data.get("stop_loss"),
+                "pnl": trade_data.get("pnl"),
+                "size": trade_data.get("size"),
+                "trade_type": trade_data.get("type"),
+                "pnl_percentage": trade_data.get("pnl_percentage"),
+                "exit_reason": trade_data.get("exit_reason"),
+            }
+            for trade_data in trades_data
+        ]
+
+        # Executemany skips per-object unit-of-work bookkeeping
+        if trade_rows:
+            self.db.execute(insert(Trade), trade_rows)
 
     def _create_symbols(
         self, backtest: BacktestResult, symbols_data: list
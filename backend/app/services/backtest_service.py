@@ -3,6 +3,7 @@ Backtest service - Business logic layer
 Handles serialization, caching, pagination, and business rules
 """
 from typing import Optional, Dict, Any, List
+from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.repositories.backtest_repository import BacktestRepository
 from app.services.backtest import BacktestSerializer, BacktestCache
@@ -12,8 +13,9 @@ from app.utils.pagination import Paginator
 class BacktestService:
     """Service for backtest business logic"""
 
-    def __init__(self):
-        self.db = next(get_db())
+    def __init__(self, db: Optional[Session] = None):
+        # Callers saving many backtests can share one session
+        self.db = db if db is not None else next(get_db())
         self.repository = BacktestRepository(self.db)
 
     def _generate_unique_title(self, base_title: str) -> str:
@@ -1,5 +1,5 @@
 import asyncio
-import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from app.models.backtest_symbol import BacktestSymbol
 from app.db.database import get_db
@@ -7,6 +7,32 @@ from app.utils.symbol_utils import normalize_symbol_for_api, symbol_to_filename
 from .cache import ExchangeCache
 
 
+@lru_cache(maxsize=1024)
+def _page_bounds(
+    oldest_ts: int, newest_ts: int, tf_ms: int, page: int, page_size: int
+) -> tuple[int, int, int, int, int]:
+    """
+    Compute pagination bounds for a candle range.
+    Returns (page, fetch_since, fetch_limit, total_count, total_pages).
+    """
+    total_count = ((newest_ts - oldest_ts) // tf_ms) + 1
+    total_pages = (total_count + page_size - 1) // page_size
+
+    if page < 1:
+        page = 1
+    elif page > total_pages and total_pages > 0:
+        page = total_pages
+
+    newest_idx = total_count - 1
+    start_idx = newest_idx - (page - 1) * page_size
+    end_idx = max(0, start_idx - page_size + 1)
+
+    fetch_limit = start_idx - end_idx + 1
+    fetch_since = oldest_ts + end_idx * tf_ms
+
+    return page, fetch_since, fetch_limit, total_count, total_pages
+
+
 class CandleHandler:
     """Handles candlestick data operations"""
 
@@ -26,8 +52,14 @@ class CandleHandler:
         "1M": 30 * 24 * 60 * 60 * 1000,
     }
 
+    # Disable CCXT's internal chunked pagination, we page ourselves.
+    # Pass a copy per call, CCXT may mutate the params it is given.
+    FETCH_PARAMS = {"paginate": False}
+
     def __init__(self, exchange):
         self.exchange = exchange
+        # Keep references so background tasks are not garbage collected
+        self._background_tasks = set()
 
     def normalize_timeframe(self, timeframe: str) -> str:
         """Normalize timeframe format"""
@@ -62,11 +94,11 @@ class CandleHandler:
             db.close()
         return None, None
 
-    def background_fetch_oldest(self, symbol: str, timeframe: str) -> None:
+    async def background_fetch_oldest(self, symbol: str, timeframe: str) -> None:
         """Background task to fetch oldest candle"""
         try:
             oldest_possible = 946684800000  # 2000-01-01 UTC in ms
-            oldest_candle = self.exchange.fetch_ohlcv(
+            oldest_candle = await self.exchange.fetch_ohlcv(
                 symbol, timeframe, oldest_possible, 1
             )
             if oldest_candle:
@@ -94,36 +126,55 @@ class CandleHandler:
         tf_ms = self.TIMEFRAME_MS.get(timeframe, 60 * 1000)
 
         # Get date range limits if backtest_id provided
-        start_limit, end_limit = None, None
         if backtest_id is not None:
             start_limit, end_limit = self.get_backtest_date_range(backtest_id, symbol)
+            if start_limit is not None and end_limit is not None:
+                # The backtest range fixes both bounds, no newest-page fetch needed
+                return await self._fetch_with_pagination(
+                    symbol,
+                    timeframe,
+                    start_limit,
+                    end_limit,
+                    tf_ms,
+                    page,
+                    page_size,
+                    backtest_id,
+                )
 
-        # Fetch newest candle
-        newest_candle = await asyncio.to_thread(
-            self.exchange.fetch_ohlcv, symbol, timeframe, None, 1
+        # Fetch the newest page; its last row is the newest candle, and it
+        # doubles as the first page so cold-start loads need a single call
+        newest_page = await self.exchange.fetch_ohlcv(
+            symbol,
+            timeframe,
+            None,
+            page_size,
+            dict(self.FETCH_PARAMS),
         )
-        if not newest_candle:
+        if not newest_page:
             return self._empty_response(page, page_size, symbol, timeframe, backtest_id)
 
-        newest_ts = newest_candle[-1][0]
+        newest_ts = newest_page[-1][0]
 
         # Get oldest timestamp
         oldest_ts = ExchangeCache.get_oldest_candle(symbol, timeframe)
 
-        # Override with backtest range if provided
-        if start_limit is not None and end_limit is not None:
-            oldest_ts = start_limit
-            newest_ts = end_limit
-
         if oldest_ts is not None:
             # We have full range, can calculate pagination
             return await self._fetch_with_pagination(
-                symbol, timeframe, oldest_ts, newest_ts, tf_ms, page, page_size, backtest_id
+                symbol,
+                timeframe,
+                oldest_ts,
+                newest_ts,
+                tf_ms,
+                page,
+                page_size,
+                backtest_id,
+                newest_page,
             )
         else:
             # No cache, start background fetch and return first page
             return await self._fetch_without_pagination(
-                symbol, timeframe, page, page_size, backtest_id
+                symbol, timeframe, page, page_size, backtest_id, newest_page
             )
 
     async def _fetch_with_pagination(
@@ -136,31 +187,26 @@ class CandleHandler:
         page: int,
         page_size: int,
         backtest_id: Optional[int],
+        newest_page: Optional[list] = None,
     ) -> Dict[str, Any]:
         """Fetch candles with full pagination info"""
-        total_count = ((newest_ts - oldest_ts) // tf_ms) + 1
-        total_pages = (total_count + page_size - 1) // page_size
-
-        if page < 1:
-            page = 1
-        elif page > total_pages and total_pages > 0:
-            page = total_pages
-
-        newest_idx = total_count - 1
-        start_idx = newest_idx - (page - 1) * page_size
-        end_idx = max(0, start_idx - page_size + 1)
-
-        fetch_limit = start_idx - end_idx + 1
-        fetch_since = oldest_ts + end_idx * tf_ms
-
-        # Use the properly formatted symbol (already normalized)
-        candles = await asyncio.to_thread(
-            self.exchange.fetch_ohlcv,
-            symbol,
-            timeframe,
-            fetch_since,
-            fetch_limit,
+        # Bounds only change when a new candle closes, so memoize them
+        page, fetch_since, fetch_limit, total_count, total_pages = _page_bounds(
+            oldest_ts, newest_ts, tf_ms, page, page_size
         )
+
+        if page == 1 and newest_page is not None:
+            # First page is the tail of the already fetched newest page
+            candles = newest_page[-fetch_limit:]
+        else:
+            # Use the properly formatted symbol (already normalized)
+            candles = await self.exchange.fetch_ohlcv(
+                symbol,
+                timeframe,
+                fetch_since,
+                fetch_limit,
+                dict(self.FETCH_PARAMS),
+            )
         candles = candles[::-1]
 
         has_next = page < total_pages and len(candles) == page_size
@@ -189,23 +235,24 @@ class CandleHandler:
         page: int,
         page_size: int,
         backtest_id: Optional[int],
+        newest_page: Optional[list] = None,
     ) -> Dict[str, Any]:
         """Fetch candles without full pagination (cache miss)"""
         # Start background fetch
-        threading.Thread(
-            target=self.background_fetch_oldest,
-            args=(symbol, timeframe),
-            daemon=True,
-        ).start()
-
-        # Fetch newest candles for this page (use properly formatted symbol)
-        candles = await asyncio.to_thread(
-            self.exchange.fetch_ohlcv,
-            symbol,
-            timeframe,
-            None,
-            page_size,
-        )
+        task = asyncio.create_task(self.background_fetch_oldest(symbol, timeframe))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        # Reuse the newest page when available (use properly formatted symbol)
+        candles = newest_page
+        if candles is None:
+            candles = await self.exchange.fetch_ohlcv(
+                symbol,
+                timeframe,
+                None,
+                page_size,
+                dict(self.FETCH_PARAMS),
+            )
         candles = candles[::-1]
 
         has_next = len(candles) == page_size
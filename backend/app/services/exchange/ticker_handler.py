@@ -1,45 +1,177 @@
-import asyncio
+import operator
+import time
 from typing import List, Dict, Any, Optional
+import numpy as np
 from .cache import ExchangeCache
+from app.config import settings
 from app.utils.pagination import Paginator
 from app.utils.symbol_utils import normalize_symbol_for_display
 
 
+# Fixed-width record layout for the in-process ticker snapshot.
+# Missing numeric values are stored as NaN, missing strings as "".
+TICKER_DTYPE = np.dtype(
+    [
+        ("symbol", "U32"),
+        ("base", "U24"),
+        ("quote", "U16"),
+        ("last", "f8"),
+        ("bid", "f8"),
+        ("ask", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("volume", "f8"),
+        ("quoteVolume", "f8"),
+        ("change", "f8"),
+        ("percentage", "f8"),
+        ("timestamp", "f8"),
+    ]
+)
+STRING_FIELDS = ("symbol", "base", "quote")
+NUMERIC_SORT_FIELDS = ("volume", "quoteVolume", "last", "change", "percentage")
+SORT_FIELDS = NUMERIC_SORT_FIELDS + ("symbol", "volumePriceRatio")
+
+# CCXT ticker keys feeding the numeric record fields, in TICKER_DTYPE order
+NUMERIC_TICKER_KEYS = (
+    "last",
+    "bid",
+    "ask",
+    "high",
+    "low",
+    "baseVolume",
+    "quoteVolume",
+    "change",
+    "percentage",
+    "timestamp",
+)
+# C-level key extraction; CCXT unified tickers always carry these keys
+_extract_numeric = operator.itemgetter(*NUMERIC_TICKER_KEYS)
+
+
+def _record_value(ticker: Dict[str, Any], name: str) -> Any:
+    """Map a ticker dict value to its record field value"""
+    value = ticker.get(name)
+    if value is None:
+        return "" if name in STRING_FIELDS else np.nan
+    return value
+
+
+def tickers_to_records(tickers: List[Dict[str, Any]]) -> np.ndarray:
+    """Pack formatted ticker dicts into a TICKER_DTYPE record array"""
+    records = np.empty(len(tickers), dtype=TICKER_DTYPE)
+    for i, ticker in enumerate(tickers):
+        records[i] = tuple(_record_value(ticker, name) for name in TICKER_DTYPE.names)
+    return records
+
+
+def records_to_tickers(records) -> List[Dict[str, Any]]:
+    """Unpack a TICKER_DTYPE record array into JSON-friendly ticker dicts"""
+    records = np.asarray(records, dtype=TICKER_DTYPE)
+    tickers = []
+    for row in records.tolist():
+        ticker = dict(zip(TICKER_DTYPE.names, row))
+        for name in STRING_FIELDS:
+            ticker[name] = ticker[name] or None
+        for name in TICKER_DTYPE.names[len(STRING_FIELDS):]:
+            if ticker[name] != ticker[name]:  # NaN
+                ticker[name] = None
+        if ticker["timestamp"] is not None:
+            ticker["timestamp"] = int(ticker["timestamp"])
+        tickers.append(ticker)
+    return tickers
+
+
+def _stable_argsort(values: np.ndarray, descending: bool) -> np.ndarray:
+    """Stable argsort that keeps original order of ties in both directions"""
+    if not descending:
+        return np.argsort(values, kind="stable")
+    reversed_order = np.argsort(values[::-1], kind="stable")[::-1]
+    return len(values) - 1 - reversed_order
+
+
 class TickerHandler:
     """Handles ticker-related operations"""
 
     def __init__(self, exchange):
         self.exchange = exchange
+        # In-process record array snapshot, refreshed every TICKER_TTL
+        self._cached_tickers: Optional[np.ndarray] = None
+        self._cached_at = 0.0
+        # Per-snapshot sort orders keyed by (sort_by, descending)
+        self._sort_orders: Dict[tuple, np.ndarray] = {}
+        # Per-snapshot lowercase "symbol\nbase\nquote" search keys
+        self._search_keys: Optional[np.ndarray] = None
+
+    def _store_snapshot(self, records: np.ndarray) -> np.ndarray:
+        """Keep a record array snapshot for subsequent requests"""
+        # Data only changes on refresh, so sort every field once up front
+        self._sort_orders = {
+            (sort_by, descending): self._sort_order(records, sort_by, descending)
+            for sort_by in SORT_FIELDS
+            for descending in (False, True)
+        }
+        self._search_keys = self._build_search_keys(records)
+        self._cached_tickers = records
+        self._cached_at = time.monotonic()
+        return records
 
-    async def fetch_all_tickers(self) -> List[Dict[str, Any]]:
+    def _fallback_snapshot(self) -> np.ndarray:
+        """Return the last known snapshot or an empty record array"""
+        if self._cached_tickers is not None:
+            return self._cached_tickers
+        return np.empty(0, dtype=TICKER_DTYPE)
+
+    async def fetch_all_tickers(self) -> np.ndarray:
         """Fetch all tickers from exchange with caching"""
-        # Check cache first
+        # Check in-process snapshot first
+        if (
+            self._cached_tickers is not None
+            and time.monotonic() - self._cached_at < ExchangeCache.TICKER_TTL
+        ):
+            return self._cached_tickers
+
+        # Then the shared cache
         cached = ExchangeCache.get_tickers()
         if cached:
-            return cached
+            return self._store_snapshot(tickers_to_records(cached))
 
         # Fetch new data
         try:
-            await asyncio.to_thread(self.exchange.load_markets)
-            tickers = await asyncio.to_thread(self.exchange.fetch_tickers)
+            await self.exchange.load_markets()
+            tickers = await self.exchange.fetch_tickers(self._ticker_symbols())
 
-            formatted_tickers = self._format_tickers(tickers)
+            records = self._format_tickers(tickers)
 
             # Cache if valid
-            if formatted_tickers:
-                ExchangeCache.set_tickers(formatted_tickers)
-                return formatted_tickers
+            if len(records) > 0:
+                ExchangeCache.set_tickers(records_to_tickers(records))
+                return self._store_snapshot(records)
             else:
                 print("Warning: No tickers received from exchange")
-                return cached or []
+                return self._fallback_snapshot()
 
         except Exception as e:
             print(f"Error fetching tickers: {e}")
-            return cached or []
+            return self._fallback_snapshot()
+
+    def _ticker_symbols(self) -> Optional[List[str]]:
+        """Perpetual symbols for the configured quote currency, None for all"""
+        quote_currency = settings.TICKER_QUOTE_CURRENCY
+        if not quote_currency:
+            return None
 
-    def _format_tickers(self, tickers: Dict) -> List[Dict[str, Any]]:
-        """Format raw ticker data"""
-        formatted = []
+        quote_upper = quote_currency.upper()
+        symbols = [
+            symbol
+            for symbol, market in self.exchange.markets.items()
+            if market.get("swap") and market.get("quote") == quote_upper
+        ]
+        return symbols or None
+
+    def _format_tickers(self, tickers: Dict) -> np.ndarray:
+        """Format raw ticker data straight into a preallocated record array"""
+        records = np.empty(len(tickers), dtype=TICKER_DTYPE)
+        count = 0
         for symbol, ticker in tickers.items():
             # Skip dated futures contracts (e.g., BTC/USDT:USDT-260424)
             # Only keep perpetual swaps (e.g., BTC/USDT:USDT)
@@ -72,29 +204,24 @@ class TickerHandler:
                         base = parts[0]
                         quote = parts[1]
 
-            formatted.append(
-                {
-                    "symbol": normalized_symbol,
-                    "base": base,
-                    "quote": quote,
-                    "last": ticker.get("last"),
-                    "bid": ticker.get("bid"),
-                    "ask": ticker.get("ask"),
-                    "high": ticker.get("high"),
-                    "low": ticker.get("low"),
-                    "volume": ticker.get("baseVolume"),
-                    "quoteVolume": ticker.get("quoteVolume"),
-                    "change": ticker.get("change"),
-                    "percentage": ticker.get("percentage"),
-                    "timestamp": ticker.get("timestamp"),
-                }
+            try:
+                numeric = _extract_numeric(ticker)
+            except KeyError:
+                numeric = tuple(ticker.get(key) for key in NUMERIC_TICKER_KEYS)
+
+            records[count] = (
+                normalized_symbol,
+                base or "",
+                quote or "",
+                *(np.nan if value is None else value for value in numeric),
             )
-        return formatted
+            count += 1
+        return records[:count]
 
     async def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """Get specific ticker data"""
         try:
-            ticker = await asyncio.to_thread(self.exchange.fetch_ticker, symbol)
+            ticker = await self.exchange.fetch_ticker(symbol)
             return {
                 "symbol": ticker.get("symbol"),
                 "base": ticker.get("base"),
@@ -116,75 +243,78 @@ class TickerHandler:
 
     def filter_and_sort_tickers(
         self,
-        tickers: List[Dict[str, Any]],
+        tickers: np.ndarray,
         search: Optional[str] = None,
         quote_currency: Optional[str] = "USDT",
         sort_by: str = "last",
         sort_order: str = "desc",
-    ) -> List[Dict[str, Any]]:
+    ) -> np.ndarray:
         """Filter and sort tickers"""
-        filtered = tickers
+        descending = sort_order.lower() == "desc"
+
+        # Reuse the precomputed order and search keys for the current snapshot
+        if tickers is self._cached_tickers:
+            order = self._sort_orders.get((sort_by, descending))
+            search_keys = self._search_keys
+        else:
+            order = self._sort_order(tickers, sort_by, descending)
+            search_keys = None
+
+        # Sorting first is equivalent since filtering keeps relative order
+        if order is not None:
+            tickers = tickers[order]
+            if search_keys is not None:
+                search_keys = search_keys[order]
+
+        mask = np.ones(len(tickers), dtype=bool)
 
         # Apply search filter
         if search:
-            search_lower = search.lower()
-            filtered = [
-                ticker
-                for ticker in filtered
-                if (
-                    search_lower in (ticker.get("symbol", "")).lower()
-                    or search_lower in (ticker.get("base", "")).lower()
-                    or search_lower in (ticker.get("quote", "")).lower()
-                )
-            ]
+            if search_keys is None:
+                search_keys = self._build_search_keys(tickers)
+            mask &= np.char.find(search_keys, search.lower()) >= 0
 
         # Apply quote currency filter
         if quote_currency:
-            quote_upper = quote_currency.upper()
-            filtered = [
-                ticker for ticker in filtered if ticker.get("quote") == quote_upper
-            ]
-
-        # Apply sorting
-        filtered = self._sort_tickers(filtered, sort_by, sort_order)
+            mask &= tickers["quote"] == quote_currency.upper()
 
-        return filtered
+        return tickers[mask]
 
-    def _sort_tickers(
-        self, tickers: List[Dict[str, Any]], sort_by: str, sort_order: str
-    ) -> List[Dict[str, Any]]:
-        """Sort tickers by specified field"""
-        reverse = sort_order.lower() == "desc"
+    @staticmethod
+    def _build_search_keys(tickers: np.ndarray) -> np.ndarray:
+        """Lowercase symbol, base and quote joined into one searchable column"""
+        keys = np.char.add(np.char.add(tickers["symbol"], "\n"), tickers["base"])
+        keys = np.char.add(np.char.add(keys, "\n"), tickers["quote"])
+        return np.char.lower(keys)
 
-        if sort_by in ["volume", "quoteVolume", "last", "change", "percentage"]:
-
-            def get_sort_value(ticker):
-                value = ticker.get(sort_by)
-                if value is None:
-                    return 0 if reverse else float("inf")
-                return value
-
-            tickers.sort(key=get_sort_value, reverse=reverse)
+    @staticmethod
+    def _sort_order(
+        tickers: np.ndarray, sort_by: str, descending: bool
+    ) -> Optional[np.ndarray]:
+        """Indices sorting tickers by the given field, None if not sortable"""
+        if sort_by in NUMERIC_SORT_FIELDS:
+            values = tickers[sort_by]
+            # Missing values sort last: as 0 when descending, NaN sorts last ascending
+            if descending:
+                values = np.nan_to_num(values, nan=0.0)
 
         elif sort_by == "symbol":
-            tickers.sort(key=lambda x: x.get("symbol", ""), reverse=reverse)
+            values = tickers["symbol"]
 
         elif sort_by == "volumePriceRatio":
+            volume = np.nan_to_num(tickers["volume"], nan=0.0)
+            price = np.nan_to_num(tickers["last"], nan=0.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = np.where(price > 0, volume / price, 0.0)
 
-            def get_volume_price_ratio(ticker):
-                volume = ticker.get("volume", 0)
-                price = ticker.get("last", 0)
-                if price and price > 0:
-                    return volume / price
-                return 0
-
-            tickers.sort(key=get_volume_price_ratio, reverse=reverse)
+        else:
+            return None
 
-        return tickers
+        return _stable_argsort(values, descending)
 
     def build_ticker_response(
         self,
-        tickers: List[Dict[str, Any]],
+        tickers: np.ndarray,
         page: int,
         page_size: int,
         search: Optional[str],
@@ -200,10 +330,13 @@ class TickerHandler:
             "sort_order": sort_order,
         }
 
-        return Paginator.create_response(
+        response = Paginator.create_response(
             items=tickers,
             page=page,
             page_size=page_size,
             filters=filters,
             items_key="tickers",
         )
+        # Only the requested page is unpacked back into dicts
+        response["tickers"] = records_to_tickers(response["tickers"])
+        return response
@@ -1,4 +1,4 @@
-import ccxt
+import ccxt.async_support as ccxt_async
 import asyncio
 from typing import List, Dict, Any, Optional
 
@@ -10,7 +10,7 @@ class ExchangeService:
     """Service for handling exchange operations with Bybit"""
 
     def __init__(self):
-        self.exchange = ccxt.bybit(
+        self.exchange = ccxt_async.bybit(
             {"enableRateLimit": True, "options": {"defaultType": "swap"}}
         )
         self._markets_loaded = False
@@ -25,9 +25,13 @@ class ExchangeService:
         if not self._markets_loaded:
             async with self._markets_lock:
                 if not self._markets_loaded:
-                    await asyncio.to_thread(self.exchange.load_markets)
+                    await self.exchange.load_markets()
                     self._markets_loaded = True
 
+    async def close(self):
+        """Close the underlying exchange HTTP session"""
+        await self.exchange.close()
+
     async def get_tickers_paginated(
         self,
         page: int = 1,
@@ -42,7 +46,7 @@ class ExchangeService:
             # Fetch all tickers (cached)
             all_tickers = await self.ticker_handler.fetch_all_tickers()
 
-            if not all_tickers:
+            if len(all_tickers) == 0:
                 return self.ticker_handler.build_ticker_response(
                     [], page, page_size, search, quote_currency, sort_by, sort_order
                 )
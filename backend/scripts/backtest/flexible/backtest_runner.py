@@ -1,15 +1,18 @@
 """
 Backtest execution
 """
+import logging
 from typing import Dict, Any
 import pandas as pd
 from backtesting import Backtest
 
+logger = logging.getLogger("backtest.runner")
+
 
 def run_backtest(
     strategy_instance: Any,
     prepared_data: Dict[str, pd.DataFrame],
-    timeframes: list,
+    main_data: pd.DataFrame,
     cash: float
 ):
     """
@@ -18,7 +21,7 @@ def run_backtest(
     Args:
         strategy_instance: Strategy instance
         prepared_data: Prepared data dict
-        timeframes: List of timeframes
+        main_data: Main timeframe data driving the backtest engine
         cash: Initial cash
         
     Returns:
@@ -27,10 +30,6 @@ def run_backtest(
     # Create strategy class for backtesting
     BacktestStrategy = strategy_instance.build_backtest_strategy(prepared_data)
     
-    # Use main timeframe for backtesting engine
-    main_timeframe = timeframes[0]
-    main_data = prepared_data[main_timeframe]
-    
     # Run backtest
     print("\n🔄 Running backtest...")
     bt = Backtest(
@@ -49,6 +48,5 @@ def run_backtest(
         return stats, bt
     except Exception as e:
         print(f"❌ Error running backtest: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Backtest run failed")
         return None, None
@@ -2,14 +2,22 @@
 CLI argument parsing and command handling
 """
 import argparse
+from functools import lru_cache
+import itertools
 import json
+import logging
 import sys
 from typing import Dict, Any, List, Optional
 from app.backtesting.strategies import list_strategies, get_strategy_info
+from flexible.json_utils import dumps_pretty
 
+# Shared by the CLI process and batch workers
+LOG_FORMAT = "%(levelname)s %(name)s: %(message)s"
 
+
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure argument parser"""
+    """Create and configure argument parser (built once, parsing never mutates it)"""
     parser = argparse.ArgumentParser(
         description="Flexible Backtesting System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -26,17 +34,40 @@ Examples:
   
   # Run with custom parameters
   python flexible_backtest.py --strategy crash_buy_dca --symbol BTCUSDT --params '{"base_amount": 200, "crash_multiplier": 4}'
+  
+  # Run a parameter sweep in parallel (JSON file with a list of parameter sets)
+  python flexible_backtest.py --strategy simple_ma_cross --symbol BTCUSDT --sweep sweep.json
+  
+  # Backtest several symbols in parallel
+  python flexible_backtest.py --strategy simple_ma_cross --symbols BTCUSDT,ETHUSDT,SOLUSDT
+  
+  # Backtest a date range only (missing data is scraped first)
+  python flexible_backtest.py --strategy simple_ma_cross --symbol BTCUSDT --start-date 2024-01-01 --end-date 2024-06-30
+  
+  # Sweep every combination of the listed parameter values
+  python flexible_backtest.py --strategy simple_ma_cross --symbol BTCUSDT --param-grid '{"fast_ma": [5, 10], "slow_ma": [20, 30]}'
         """
     )
     
     parser.add_argument("--list-strategies", action="store_true", help="List all available strategies")
     parser.add_argument("--strategy-info", type=str, help="Get detailed info about a strategy")
     parser.add_argument("--strategy", type=str, help="Strategy to use")
-    parser.add_argument("--symbol", type=str, default="BTCUSDT", help="Trading symbol")
+    parser.add_argument("--symbol", "--symbols", type=str, default="BTCUSDT", help="Trading symbol(s), comma-separated symbols run in parallel")
     parser.add_argument("--timeframes", type=str, default="1d", help="Comma-separated timeframes")
     parser.add_argument("--params", type=str, help="JSON string of strategy parameters")
     parser.add_argument("--cash", type=float, default=1000000, help="Initial cash")
+    parser.add_argument("--start-date", type=str, help="Start date (YYYY-MM-DD), requires --end-date")
+    parser.add_argument("--end-date", type=str, help="End date (YYYY-MM-DD), requires --start-date")
     parser.add_argument("--save-to-db", action="store_true", help="Save results to database")
+    parser.add_argument("--sweep", type=str, help="JSON file with a list of parameter sets to run in parallel")
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level for data loading and backtest diagnostics (default: INFO, WARNING hides progress)"
+    )
+    parser.add_argument("--param-grid", type=str, help="JSON object mapping parameters to lists of values; every combination is run in parallel")
     
     return parser
 
@@ -61,7 +92,7 @@ def handle_strategy_info(strategy_name: str):
         print(f"Description: {info['description']}")
         print(f"Timeframes: {', '.join(info['timeframes'])}")
         print(f"\nDefault Parameters:")
-        print(json.dumps(info['default_parameters'], indent=2))
+        print(dumps_pretty(info['default_parameters']))
     except Exception as e:
         print(f"❌ Error getting strategy info: {e}")
 
@@ -78,20 +109,69 @@ def parse_parameters(params_str: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
+def parse_sweep_file(sweep_path: str) -> List[Dict[str, Any]]:
+    """Parse a JSON file containing a list of parameter sets"""
+    try:
+        with open(sweep_path) as f:
+            parameter_sets = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Could not read sweep file {sweep_path}: {e}")
+        sys.exit(1)
+    
+    if not isinstance(parameter_sets, list) or not all(
+        isinstance(parameters, dict) for parameters in parameter_sets
+    ):
+        print("❌ Sweep file must contain a JSON list of parameter objects")
+        sys.exit(1)
+    
+    return parameter_sets
+
+
+def parse_param_grid(grid_str: str) -> List[Dict[str, Any]]:
+    """Expand a JSON parameter grid into one parameter set per combination"""
+    grid = parse_parameters(grid_str)
+    
+    if not isinstance(grid, dict) or not grid:
+        print("❌ Parameter grid must be a non-empty JSON object")
+        sys.exit(1)
+    
+    # An empty axis would silently expand to zero runs
+    for name, values in grid.items():
+        if not isinstance(values, list) or not values:
+            print(f"❌ Parameter grid value for '{name}' must be a non-empty JSON list")
+            sys.exit(1)
+    
+    names = list(grid)
+    return [dict(zip(names, combination)) for combination in itertools.product(*grid.values())]
+
+
 def parse_timeframes(timeframes_str: str) -> List[str]:
     """Parse comma-separated timeframes string"""
     return [tf.strip() for tf in timeframes_str.split(",")]
 
 
-def parse_and_handle_args() -> Optional[Dict[str, Any]]:
+def parse_symbols(symbols_str: str) -> List[str]:
+    """Parse comma-separated symbols string (duplicates dropped, order kept)"""
+    return list(dict.fromkeys(
+        symbol.strip() for symbol in symbols_str.split(",") if symbol.strip()
+    ))
+
+
+def parse_and_handle_args(argv: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """
     Parse command line arguments and handle commands
     
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
     Returns:
         Dict with backtest configuration if should run backtest, None otherwise
     """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    # Failures and data loading are reported through loggers; tracebacks show at ERROR
+    logging.basicConfig(level=args.log_level, format=LOG_FORMAT)
     
     # Handle list strategies command
     if args.list_strategies:
@@ -108,16 +188,44 @@ def parse_and_handle_args() -> Optional[Dict[str, Any]]:
         print("❌ Please specify a strategy with --strategy")
         sys.exit(1)
     
-    # Parse parameters and timeframes
+    # The date range is only applied when both ends are given
+    if bool(args.start_date) != bool(args.end_date):
+        print("❌ Please specify both --start-date and --end-date")
+        sys.exit(1)
+    
+    # Parse parameters, timeframes and symbols
     parameters = parse_parameters(args.params)
     timeframes = parse_timeframes(args.timeframes)
+    symbols = parse_symbols(args.symbol)
+    if not symbols:
+        print("❌ Please specify at least one symbol with --symbol")
+        sys.exit(1)
     
     # Return backtest configuration
-    return {
+    config = {
         "strategy_name": args.strategy,
-        "symbol": args.symbol,
+        "symbol": symbols[0],
         "parameters": parameters,
         "timeframes": timeframes,
         "cash": args.cash,
-        "save_to_db": args.save_to_db
+        "save_to_db": args.save_to_db,
+        "start_date": args.start_date,
+        "end_date": args.end_date
     }
+    
+    # Parameter sets layered on top of --params, one backtest each
+    parameter_sweep = []
+    if args.sweep:
+        parameter_sweep.extend(parse_sweep_file(args.sweep))
+    if args.param_grid:
+        parameter_sweep.extend(parse_param_grid(args.param_grid))
+    if parameter_sweep:
+        # Identical sets would only repeat a run under the same title
+        unique_sets = {json.dumps(parameters, sort_keys=True): parameters for parameters in parameter_sweep}
+        config["parameter_sweep"] = list(unique_sets.values())
+    
+    # Several symbols run as independent backtests, like a sweep
+    if len(symbols) > 1:
+        config["symbol_sweep"] = symbols
+    
+    return config
@@ -3,10 +3,16 @@ Data Loading Module
 Handles loading and preparing multi-timeframe data for backtesting
 """
 
+import logging
 import os
 import sys
+import threading
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 
 # Add app directory to path
@@ -16,6 +22,184 @@ if app_dir not in sys.path:
 
 from utils.symbol_utils import normalize_symbol_for_api, symbol_to_filename
 
+logger = logging.getLogger("backtest.data")
+
+# Columns a chart CSV contributes to a backtest
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+# CSVs above this size are parsed in chunks to bound peak memory
+LARGE_CSV_BYTES = 200 * 1024 * 1024
+CSV_CHUNK_ROWS = 500_000
+
+
+def _read_ohlcv_csv(filepath: str) -> pd.DataFrame:
+    """
+    Read and clean an OHLCV CSV, using a Parquet copy as an on-disk cache
+    
+    The cache lives in a .cache/ directory next to the CSV, is reused while
+    it is at least as new as the CSV and is rebuilt whenever the CSV
+    changes (e.g. after scraping).
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        DataFrame indexed by Date, sorted and de-duplicated
+    
+    Raises:
+        ValueError: If the OHLCV values fail validation
+    """
+    csv_dir, csv_name = os.path.split(filepath)
+    cache_dir = os.path.join(csv_dir, ".cache")
+    cache_path = os.path.join(cache_dir, os.path.splitext(csv_name)[0] + ".parquet")
+    
+    try:
+        cache_fresh = os.stat(cache_path).st_mtime_ns >= os.stat(filepath).st_mtime_ns
+    except FileNotFoundError:
+        cache_fresh = False
+    
+    if cache_fresh:
+        try:
+            # Memory-map the file instead of buffering it through reads
+            return pd.read_parquet(cache_path, engine="pyarrow", memory_map=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable cache {cache_path}: {e}")
+    
+    # Arrow's multi-threaded tokenizer, falling back to the C engine.
+    # Date is indexed afterwards: the pyarrow engine fails when dtype and
+    # index_col are combined.
+    read_kwargs = {
+        "usecols": OHLCV_COLUMNS,  # Auxiliary columns would only become object data
+        "dtype": {column: "float64" for column in OHLCV_COLUMNS[1:]},  # Skip type inference
+        "parse_dates": ["Date"],
+    }
+    if os.path.getsize(filepath) > LARGE_CSV_BYTES:
+        # Arrow materializes the whole table next to the frame; stream chunks
+        # instead so only one chunk is held on top of the result
+        chunks = pd.read_csv(filepath, engine="c", chunksize=CSV_CHUNK_ROWS, **read_kwargs)
+        data = pd.concat(chunks, ignore_index=True, copy=False)
+    else:
+        try:
+            data = pd.read_csv(filepath, engine="pyarrow", **read_kwargs)
+        except ImportError:
+            data = pd.read_csv(filepath, engine="c", **read_kwargs)
+    
+    # Arrow parses to second resolution; keep the nanosecond index of the C engine
+    data = data.set_index("Date")
+    data.index = data.index.as_unit("ns")
+    
+    # Scraped CSVs are normally sorted and unique, skip the work when they are.
+    # A stable sort keeps file order within a timestamp, so keeping the last
+    # duplicate keeps the most recently scraped candle.
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index(kind="stable")
+    if data.index.has_duplicates:
+        data = data[~data.index.duplicated(keep="last")]
+    
+    # Exchange dumps often leave Volume empty on quiet bars
+    if data["Volume"].hasnans:
+        data = data.fillna({"Volume": 0.0})
+    
+    # Only validated data is cached, so cache hits skip the check
+    _validate_ohlcv(data, filepath)
+    
+    # Write atomically so concurrent backtests never read a partial file.
+    # Timeframes load on threads, so the name is unique per thread too.
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        data.to_parquet(tmp_path, engine="pyarrow", compression="snappy")
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not write cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return data
+
+
+def _validate_ohlcv(data: pd.DataFrame, filepath: str):
+    """
+    Check prices once at load time so strategies can assume clean bars
+    
+    Volume is not checked, missing volume is filled before validation.
+    
+    Raises:
+        ValueError: If any price is NaN/Inf or not positive
+    """
+    # Select by name, usecols keeps the file's column order
+    prices = data[["Open", "High", "Low", "Close"]].to_numpy()
+    if not np.isfinite(prices).all():
+        raise ValueError(f"NaN/Inf in OHLCV data of {filepath}")
+    if (prices <= 0).any():
+        raise ValueError(f"Non-positive price in OHLCV data of {filepath}")
+
+
+# Parsed frames by CSV path as (mtime_ns, frame), least recently used first.
+# Kept small since this module also runs inside the API server process.
+_ohlcv_cache: "OrderedDict[str, Tuple[int, pd.DataFrame]]" = OrderedDict()
+_ohlcv_cache_lock = threading.Lock()
+OHLCV_CACHE_SIZE = 4
+
+
+def _load_ohlcv(filepath: str) -> pd.DataFrame:
+    """
+    Load an OHLCV CSV, reusing frames already parsed in this process
+    
+    Sweep workers run many backtests on the same files, so repeat loads
+    skip even the Parquet read. Each path holds at most one frame, which
+    is replaced when the CSV's mtime changes (e.g. after scraping).
+    Callers get a deep copy, so no in-place write (new columns, .loc
+    assignments, .values mutation) can leak into the next run.
+    """
+    mtime_ns = os.stat(filepath).st_mtime_ns
+    
+    with _ohlcv_cache_lock:
+        cached = _ohlcv_cache.get(filepath)
+        if cached is not None and cached[0] == mtime_ns:
+            _ohlcv_cache.move_to_end(filepath)
+            return cached[1].copy()
+    
+    # Parse outside the lock so timeframes still load concurrently
+    data = _read_ohlcv_csv(filepath)
+    
+    with _ohlcv_cache_lock:
+        _ohlcv_cache[filepath] = (mtime_ns, data)
+        _ohlcv_cache.move_to_end(filepath)
+        while len(_ohlcv_cache) > OHLCV_CACHE_SIZE:
+            _ohlcv_cache.popitem(last=False)
+    
+    return data.copy()
+
+
+@lru_cache(maxsize=8)
+def _scan_chart_dir(charts_dir: str, mtime_ns: int) -> FrozenSet[str]:
+    """Scan charts_dir for CSV files; keyed on the directory mtime"""
+    with os.scandir(charts_dir) as entries:
+        return frozenset(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".csv") and entry.is_file()
+        )
+
+
+def _list_chart_files(charts_dir: str) -> FrozenSet[str]:
+    """
+    List the chart directory so file lookups are set membership tests
+    
+    The scan is reused across loads in the same process until a file is
+    added or removed (e.g. by scraping), which bumps the directory mtime.
+    scandir's entries carry the file type from the directory read, so
+    skipping the .cache/ directory and other non-files costs no extra stat.
+    
+    Returns:
+        Set of CSV file names in charts_dir (empty if the directory is missing)
+    """
+    try:
+        return _scan_chart_dir(charts_dir, os.stat(charts_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return frozenset()
+
 
 def check_and_scrape_data(
     symbol: str,
@@ -45,71 +229,151 @@ def check_and_scrape_data(
     
     exchanges = ["bybit", "binance", "okx"]
     needs_scraping = False
+    available_files = _list_chart_files(charts_dir)
     
     for timeframe in timeframes:
         data_found = False
         
         for exchange in exchanges:
             filename = f"{safe_symbol}-{timeframe}-{exchange}.csv"
-            filepath = os.path.join(charts_dir, filename)
             
-            if os.path.exists(filepath):
+            if filename in available_files:
+                filepath = os.path.join(charts_dir, filename)
+                
                 # Check if data covers the requested date range
                 try:
-                    df = pd.read_csv(filepath)
-                    df['Date'] = pd.to_datetime(df['Date'])
+                    df = _load_ohlcv(filepath)
                     
-                    data_start = df['Date'].min()
-                    data_end = df['Date'].max()
+                    data_start = df.index.min()
+                    data_end = df.index.max()
                     
                     requested_start = pd.to_datetime(start_date)
                     requested_end = pd.to_datetime(end_date)
                     
                     if data_start <= requested_start and data_end >= requested_end:
                         data_found = True
-                        print(f"✓ Data exists for {safe_symbol} {timeframe} ({exchange})")
+                        logger.info(f"✓ Data exists for {safe_symbol} {timeframe} ({exchange})")
                         break
                     else:
-                        print(f"Data exists but doesn't cover full range for {safe_symbol} {timeframe}")
-                        print(f"  Available: {data_start.date()} to {data_end.date()}")
-                        print(f"  Requested: {requested_start.date()} to {requested_end.date()}")
+                        logger.info(
+                            f"Data exists but doesn't cover full range for {safe_symbol} {timeframe}"
+                            f" (available: {data_start.date()} to {data_end.date()},"
+                            f" requested: {requested_start.date()} to {requested_end.date()})"
+                        )
                         needs_scraping = True
                 except Exception as e:
-                    print(f"⚠️ Error reading {filepath}: {e}")
+                    logger.warning(f"⚠️ Error reading {filepath}: {e}")
                     needs_scraping = True
         
         if not data_found:
-            print(f"❌ No data found for {safe_symbol} {timeframe}")
+            logger.warning(f"⚠️ No data found for {safe_symbol} {timeframe}")
             needs_scraping = True
     
     if needs_scraping:
-        print(f"\n📥 Scraping data for {api_symbol}...")
-        print(f"   Timeframes: {', '.join(timeframes)}")
-        print(f"   Date range: {start_date} to {end_date}")
+        logger.info(
+            f"📥 Scraping data for {api_symbol} "
+            f"(timeframes: {', '.join(timeframes)}; date range: {start_date} to {end_date})"
+        )
         
         try:
             import asyncio
             from app.backtesting.scraper.fetcher import fetch_and_save_historical_data
             
+            # One in-process call covers every requested timeframe
             params = {
                 "symbol": api_symbol,
-                "timeframe": timeframe,
+                "timeframe": list(timeframes),
                 "start_date": start_date,
                 "end_date": end_date,
                 "exchange": "bybit"
             }
             
-            asyncio.run(fetch_and_save_historical_data(params))
-            print(f"✓ Data scraped successfully for {api_symbol}")
+            if not asyncio.run(fetch_and_save_historical_data(params)):
+                logger.error(f"❌ Failed to scrape data for {api_symbol}")
+                return False
+            
+            logger.info(f"✓ Data scraped successfully for {api_symbol}")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to scrape data: {e}")
+            logger.error(f"❌ Failed to scrape data: {e}")
             return False
     
     return True
 
 
+def _load_timeframe_data(
+    timeframe: str,
+    symbol: str,
+    safe_symbol: str,
+    charts_dir: str,
+    start_date: str = None,
+    end_date: str = None,
+    start_dt: pd.Timestamp = None,
+    end_dt: pd.Timestamp = None,
+    available_files: Optional[FrozenSet[str]] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Load data for a single timeframe, trying each exchange CSV in turn
+    
+    Returns:
+        DataFrame for the timeframe, or None if data not found
+    """
+    if available_files is None:
+        available_files = _list_chart_files(charts_dir)
+    
+    # Try different exchange suffixes
+    exchanges = ["bybit", "binance", "okx"]
+    
+    for exchange in exchanges:
+        filename = f"{safe_symbol}-{timeframe}-{exchange}.csv"
+        
+        if filename in available_files:
+            filepath = os.path.join(charts_dir, filename)
+            try:
+                data = _load_ohlcv(filepath)
+                
+                # Filter by date range if provided
+                if start_dt and end_dt:
+                    original_len = len(data)
+                    # Index is sorted and unique, so slice by binary search
+                    data = data.loc[start_dt:end_dt]
+                    filtered_len = len(data)
+                    
+                    if filtered_len == 0:
+                        logger.error(f"❌ No data available for {safe_symbol} {timeframe} in date range {start_date} to {end_date}")
+                        return None
+                    
+                    logger.info(
+                        f"📁 Loaded {timeframe} data from {filepath}: "
+                        f"{original_len} -> {filtered_len} bars, "
+                        f"{data.index[0]} to {data.index[-1]}"
+                    )
+                else:
+                    bar_count = len(data)
+                    if bar_count == 0:
+                        logger.warning(f"⚠️ {filepath} contains no bars")
+                        continue
+                    
+                    first_bar, last_bar = data.index[0], data.index[-1]
+                    logger.info(
+                        f"📁 Loaded {timeframe} data from {filepath}: "
+                        f"{first_bar} to {last_bar} ({bar_count} bars)"
+                    )
+                
+                return data
+                
+            except Exception as e:
+                logger.warning(f"⚠️ Error loading {filepath}: {e}")
+                continue
+    
+    logger.error(
+        f"❌ No data found for {safe_symbol} {timeframe}. Scrape data first: "
+        f"python scripts/scraper/ccxt_scraper.py --symbol {symbol} --timeframe {timeframe}"
+    )
+    return None
+
+
 def load_multi_timeframe_data(
     symbol: str, 
     timeframes: List[str], 
@@ -120,6 +384,8 @@ def load_multi_timeframe_data(
     """
     Load data for multiple timeframes from CSV files
     
+    Timeframes are loaded concurrently since CSV parsing releases the GIL.
+    
     Args:
         symbol: Trading symbol (e.g., "BTCUSDT", "BTC/USDT", or "BTC/USDT:USDT")
         timeframes: List of timeframes (e.g., ["1h", "4h"])
@@ -136,56 +402,29 @@ def load_multi_timeframe_data(
     # Get safe filename format (BTC/USDT:USDT -> BTCUSDT)
     safe_symbol = symbol_to_filename(api_symbol)
     
-    data_dict = {}
-    
     # Convert date strings to datetime if provided
     start_dt = pd.to_datetime(start_date) if start_date else None
     end_dt = pd.to_datetime(end_date) if end_date else None
     
-    for timeframe in timeframes:
-        # Try different exchange suffixes
-        exchanges = ["bybit", "binance", "okx"]
-        data_loaded = False
-        
-        for exchange in exchanges:
-            filename = f"{safe_symbol}-{timeframe}-{exchange}.csv"
-            filepath = os.path.join(charts_dir, filename)
-            
-            if os.path.exists(filepath):
-                try:
-                    data = pd.read_csv(filepath)
-                    data.set_index("Date", inplace=True)
-                    data.index = pd.to_datetime(data.index)
-                    data = data.sort_index().drop_duplicates()
-                    
-                    # Filter by date range if provided
-                    if start_dt and end_dt:
-                        original_len = len(data)
-                        data = data[(data.index >= start_dt) & (data.index <= end_dt)]
-                        filtered_len = len(data)
-                        
-                        if filtered_len == 0:
-                            print(f"❌ No data available for {safe_symbol} {timeframe} in date range {start_date} to {end_date}")
-                            return None
-                        
-                        print(f"📁 Loaded {timeframe} data from {filepath}")
-                        print(f"📅 Filtered: {original_len} -> {filtered_len} bars")
-                        print(f"📈 Range: {data.index[0]} to {data.index[-1]}")
-                    else:
-                        print(f"📁 Loaded {timeframe} data from {filepath}")
-                        print(f"📈 Range: {data.index[0]} to {data.index[-1]} ({len(data)} bars)")
-                    
-                    data_dict[timeframe] = data
-                    data_loaded = True
-                    break
-                    
-                except Exception as e:
-                    print(f"⚠️ Error loading {filepath}: {e}")
-                    continue
-        
-        if not data_loaded:
-            print(f"❌ No data found for {safe_symbol} {timeframe}")
-            print(f"💡 Scrape data first: python scripts/scraper/ccxt_scraper.py --symbol {symbol} --timeframe {timeframe}")
+    load_timeframe = partial(
+        _load_timeframe_data,
+        symbol=symbol,
+        safe_symbol=safe_symbol,
+        charts_dir=charts_dir,
+        start_date=start_date,
+        end_date=end_date,
+        start_dt=start_dt,
+        end_dt=end_dt,
+        available_files=_list_chart_files(charts_dir),
+    )
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(len(timeframes), 8))) as executor:
+        frames = list(executor.map(load_timeframe, timeframes))
+    
+    data_dict = {}
+    for timeframe, data in zip(timeframes, frames):
+        if data is None:
             return None
+        data_dict[timeframe] = data
     
     return data_dict
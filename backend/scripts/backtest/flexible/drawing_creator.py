@@ -8,6 +8,7 @@ from utils.symbol_utils import symbol_to_filename
 import sys
 import os
 import logging
+from collections import Counter
 from typing import List, Dict, Any
 
 # Add app directory to path
@@ -19,75 +20,6 @@ if app_dir not in sys.path:
 logger = logging.getLogger("backtest.drawings")
 
 
-def create_trade_drawings(trades_list: List[Dict], symbol: str) -> List[Dict]:
-    """
-    Create drawings for trades (long/short positions)
-    
-    Args:
-        trades_list: List of processed trades
-        symbol: Trading symbol (will be normalized to DB format)
-        
-    Returns:
-        List of drawing objects
-    """
-    # Normalize symbol to DB format: BTC/USDT:USDT -> BTCUSDT
-    normalized_symbol = symbol_to_filename(symbol)
-    
-    drawings = []
-    
-    logger.info(f"Creating drawings for {len(trades_list)} trades")
-    for i, trade in enumerate(trades_list):
-        if trade["type"] == "long":
-            drawing = {
-                "type": "long_position",
-                "id": f"trade_{i}",
-                "ticker": normalized_symbol,  # Use normalized symbol
-                "startTime": trade["entry_time"],
-                "endTime": trade["exit_time"],
-                "entryPrice": trade["entry_price"],
-                "targetPrice": (
-                    trade["take_profit"]
-                    if trade["take_profit"] is not None
-                    else trade["exit_price"]
-                ),
-                "stopPrice": (
-                    trade["stop_loss"]
-                    if trade["stop_loss"] is not None
-                    else (
-                        trade["entry_price"] * 0.98
-                        if trade["entry_price"] is not None
-                        else None
-                    )
-                ),
-            }
-        else:  # short position
-            drawing = {
-                "type": "short_position",
-                "id": f"trade_{i}",
-                "ticker": normalized_symbol,  # Use normalized symbol
-                "startTime": trade["entry_time"],
-                "endTime": trade["exit_time"],
-                "entryPrice": trade["entry_price"],
-                "targetPrice": (
-                    trade["take_profit"]
-                    if trade["take_profit"] is not None
-                    else trade["exit_price"]
-                ),
-                "stopPrice": (
-                    trade["stop_loss"]
-                    if trade["stop_loss"] is not None
-                    else (
-                        trade["entry_price"] * 1.02
-                        if trade["entry_price"] is not None
-                        else None
-                    )
-                ),
-            }
-        drawings.append(drawing)
-    
-    return drawings
-
-
 def create_strategy_drawings(
     strategy_instance: Any,
     backtest_instance: Any,
@@ -101,22 +33,24 @@ def create_strategy_drawings(
         strategy_instance: Strategy instance
         backtest_instance: Backtest instance (unused, kept for compatibility)
         symbol: Trading symbol (will be normalized to DB format)
-        existing_drawings: Existing drawings to append to
+        existing_drawings: Existing drawings to append to (extended in place)
         
     Returns:
         Combined list of drawings
     """
-    from utils.symbol_utils import symbol_to_filename
-    
     # Normalize symbol to DB format: BTC/USDT:USDT -> BTCUSDT
     normalized_symbol = symbol_to_filename(symbol)
     
-    drawings = existing_drawings.copy()
+    # The trade drawings list is owned by this run, no need to copy it
+    drawings = existing_drawings
+    
+    # Single attribute lookup for the optional hook
+    get_custom_drawings = getattr(strategy_instance, 'get_custom_drawings', None)
     
     # Get custom drawings from strategy
     try:
-        if hasattr(strategy_instance, 'get_custom_drawings'):
-            custom_drawings = strategy_instance.get_custom_drawings(normalized_symbol)
+        if get_custom_drawings is not None:
+            custom_drawings = get_custom_drawings(normalized_symbol)
             if custom_drawings:
                 logger.info(f"Strategy '{strategy_instance.name}' provided {len(custom_drawings)} custom drawings")
                 drawings.extend(custom_drawings)
@@ -127,118 +61,8 @@ def create_strategy_drawings(
     except Exception as e:
         logger.error(f"Could not get custom drawings from strategy: {e}", exc_info=True)
     
-    logger.info(f"Total drawings created: {len(drawings)}")
+    # One summary line instead of a message per drawing
+    if logger.isEnabledFor(logging.INFO):
+        type_counts = dict(Counter(drawing.get('type') for drawing in drawings))
+        logger.info(f"Total drawings created: {len(drawings)} ({type_counts})")
     return drawings
-
-
-def _create_level_drawing(level: Dict, symbol: str, drawing_count: int) -> Dict:
-    """Create a drawing for a specific level/signal"""
-    level_time = level['time'].tz_localize("UTC").isoformat()
-    
-    # Determine end time - either when broken or "relative" if still active
-    if level.get('end_time') is not None:
-        end_time = level['end_time'].tz_localize("UTC").isoformat()
-    else:
-        end_time = "relative"
-    
-    level_type = level['type']
-    
-    # Swing highs/lows
-    if level_type in ['swing_high', 'swing_low']:
-        line_color = "#00C851" if level_type == 'swing_high' else "#FF4444"
-        line_style = "dashed" if level.get('end_time') is not None else "solid"
-        
-        return {
-            "type": "line",
-            "id": f"smc_{level_type}_{drawing_count}",
-            "ticker": symbol,
-            "startTime": level_time,
-            "endTime": end_time,
-            "startPrice": level['price'],
-            "endPrice": level['price'],
-            "style": {
-                "color": line_color,
-                "width": 1,
-                "lineStyle": line_style
-            }
-        }
-    
-    # Fair Value Gaps
-    elif level_type in ['bullish_fvg', 'bearish_fvg']:
-        fvg_color = "rgba(76, 175, 80, 0.3)" if level_type == 'bullish_fvg' else "rgba(244, 67, 54, 0.3)"
-        
-        return {
-            "type": "rectangle",
-            "id": f"fvg_{level_type}_{drawing_count}",
-            "ticker": symbol,
-            "startTime": level_time,
-            "endTime": end_time,
-            "startPrice": level.get('bottom', level['price']),
-            "endPrice": level.get('top', level['price']),
-            "style": {
-                "fillColor": fvg_color,
-                "borderColor": fvg_color.replace('0.3', '0.8'),
-                "borderWidth": 1
-            }
-        }
-    
-    # Order Blocks
-    elif level_type in ['bullish_ob', 'bearish_ob']:
-        ob_color = "rgba(138, 43, 226, 0.25)" if level_type == 'bullish_ob' else "rgba(23, 82, 183, 0.25)"
-        border_color = "rgba(138, 43, 226, 0.8)" if level_type == 'bullish_ob' else "rgba(255, 152, 0, 0.8)"
-        
-        return {
-            "type": "rectangle",
-            "id": f"ob_{level_type}_{drawing_count}",
-            "ticker": symbol,
-            "startTime": level_time,
-            "endTime": end_time,
-            "startPrice": level.get('bottom', level['price']),
-            "endPrice": level.get('top', level['price']),
-            "style": {
-                "fillColor": ob_color,
-                "borderColor": border_color,
-                "borderWidth": 2
-            }
-        }
-    
-    # Signals (MACD, divergences, etc.)
-    elif level_type in ['macd_bullish_cross', 'macd_bearish_cross', 'bullish_divergence', 'bearish_divergence']:
-        price_offset = level['price'] * 0.001  # 0.1% offset for visibility
-        signal_color = "#00C851" if 'bullish' in level_type else "#FF4444"
-        
-        return {
-            "type": "line",
-            "id": f"signal_{level_type}_{drawing_count}",
-            "ticker": symbol,
-            "startTime": level_time,
-            "endTime": level_time,  # Point in time
-            "startPrice": level['price'] - price_offset,
-            "endPrice": level['price'] + price_offset,
-            "style": {
-                "color": signal_color,
-                "width": 1,
-                "lineStyle": "dotted"
-            }
-        }
-    
-    # Default horizontal line
-    else:
-        return {
-            "type": "line",
-            "id": f"custom_{level_type}_{drawing_count}",
-            "ticker": symbol,
-            "startTime": level_time,
-            "endTime": end_time,
-            "startPrice": level['price'],
-            "endPrice": level['price']
-        }
-
-
-def _print_drawing_info(level: Dict, drawing: Dict):
-    """Print information about created drawing"""
-    end_time = drawing.get('endTime', 'relative')
-    status = f"(broken {level.get('break_direction', 'unknown')})" if level.get('end_time') else "(active)"
-    level_time = drawing['startTime']
-    
-    print(f"📍 Added {level['type']} drawing at {level['price']:.4f} {status} from {level_time[:10]} to {end_time[:10] if end_time != 'relative' else 'current'}")
@@ -2,7 +2,9 @@
 Drawing Helper Functions
 Pydantic models for creating type-safe drawings
 """
-from typing import Dict, Any, Literal, Optional
+from typing import Dict, Any, List, Literal, Optional, Sequence
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel, Field
 
 
@@ -84,6 +86,21 @@ class ShortPositionDrawing(BaseModel):
         return self.model_dump()
 
 
+def to_utc_isoformat_many(times: Sequence[Any]) -> List[Optional[str]]:
+    """
+    Format naive UTC timestamps like Timestamp.tz_localize("UTC").isoformat()
+    
+    All times are formatted in one numpy pass instead of localizing each
+    Timestamp; missing entries (None/NaT) come back as None.
+    """
+    index = pd.DatetimeIndex(times)
+    iso = np.char.add(
+        np.datetime_as_string(index.to_numpy(dtype="datetime64[s]"), unit="s"), "+00:00"
+    ).astype(object)
+    iso[index.isna()] = None
+    return iso.tolist()
+
+
 # Helper functions for creating drawings
 def create_horizontal_line(
     drawing_id: str,
@@ -0,0 +1,18 @@
+"""
+JSON helpers
+Uses orjson when available and falls back to the standard library
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object to a 2-space indented JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
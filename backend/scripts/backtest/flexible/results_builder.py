@@ -4,6 +4,7 @@ Constructs the final results dictionary with all metrics
 """
 
 import json
+import logging
 import sys
 import os
 import pandas as pd
@@ -16,6 +17,8 @@ if app_dir not in sys.path:
 
 from utils.symbol_utils import symbol_to_filename, normalize_symbol_for_display
 
+logger = logging.getLogger("backtest.results")
+
 
 def calculate_additional_metrics(
     trades_list: List[Dict[str, Any]],
@@ -45,13 +48,11 @@ def calculate_additional_metrics(
     
     # Calculate from trades
     if trades_list and len(trades_list) > 0:
-        # Calculate max position value from trades
-        max_position_value = 0
-        for trade in trades_list:
-            entry_price = trade.get('entry_price', 0)
-            size = trade.get('size', 0)
-            position_value = abs(entry_price * size)
-            max_position_value = max(max_position_value, position_value)
+        # Calculate max position value from trades in a single max() pass
+        max_position_value = max(
+            (abs(trade.get('entry_price', 0) * trade.get('size', 0)) for trade in trades_list),
+            default=0,
+        )
         
         if max_position_value > 0:
             capital_deployed = max_position_value
@@ -90,13 +91,15 @@ def build_results_dict(
     drawings: List[Dict],
     main_data: pd.DataFrame,
     cash: float,
-    strategy_related_fields: List[Dict]
+    strategy_related_fields: List[Dict],
+    title_suffix: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Build the complete results dictionary
     
     Args:
         All the components needed to build results
+        title_suffix: Optional label appended to the title (e.g. sweep parameters)
         
     Returns:
         Complete results dictionary
@@ -111,8 +114,16 @@ def build_results_dict(
     # even when no trades are executed, which doesn't make sense for a trading strategy
     final_balance = cash if total_trades == 0 else stats["Equity Final [$]"]
     
+    # Localize the data range once, used for both dates and the symbols payload
+    start_ts_utc = main_data.index[0].tz_localize("UTC")
+    end_ts_utc = main_data.index[-1].tz_localize("UTC")
+    
+    title = f"{strategy_instance.name} - {display_symbol}"
+    if title_suffix:
+        title = f"{title} {title_suffix}"
+    
     results = {
-        "title": f"{strategy_instance.name} - {display_symbol}",
+        "title": title,
         "strategy_name": strategy_instance.name,
         "strategy_config": {
             "name": strategy_instance.name,
@@ -123,8 +134,8 @@ def build_results_dict(
         "trades": trades_list,
         "initial_balance": cash,
         "final_balance": final_balance,
-        "start_date": main_data.index[0].tz_localize("UTC").to_pydatetime(),
-        "end_date": main_data.index[-1].tz_localize("UTC").to_pydatetime(),
+        "start_date": start_ts_utc.to_pydatetime(),
+        "end_date": end_ts_utc.to_pydatetime(),
         "total_trades": total_trades,
         "trading_days": trading_days,
         "win_rate": stats["Win Rate [%]"] / 100,
@@ -152,8 +163,8 @@ def build_results_dict(
         "symbols": [
             {
                 "ticker": symbol_to_filename(symbol),  # Convert to DB format: BTC/USDT:USDT -> BTCUSDT
-                "start_date": main_data.index[0].tz_localize("UTC").isoformat(),
-                "end_date": main_data.index[-1].tz_localize("UTC").isoformat(),
+                "start_date": start_ts_utc.isoformat(),
+                "end_date": end_ts_utc.isoformat(),
             }
         ],
         "strategy_related_fields": strategy_related_fields,
@@ -164,43 +175,52 @@ def build_results_dict(
 
 def print_results_summary(results: Dict[str, Any]):
     """Print a summary of backtest results"""
-    print(f"\n📊 Results Summary:")
-    print(f"Total Trades: {results['total_trades']}")
-    print(f"Win Rate: {results['win_rate']:.2%}")
-    print(f"Total P&L: ${results['total_pnl']:,.2f}")
-    print(f"Final Balance: ${results['final_balance']:,.2f}")
-    print(f"Max Drawdown: {results['max_drawdown']:.2%}")
-    print(f"Sharpe Ratio: {results['sharpe_ratio']:.2f}")
-    print(f"Profit Factor: {results['profit_factor']:.2f}")
-    print(f"Profitable Trades: {results['profitable_trades']}")
-    print(f"Loss Trades: {results['loss_trades']}")
-    print(f"Long Trades: {results['long_trades']}")
-    print(f"Short Trades: {results['short_trades']}")
-    print(f"Trading Days: {results['trading_days']}")
-    print(f"Value at Risk: ${results['value_at_risk']:,.2f}")
+    # One write keeps the block together when sweep workers print concurrently
+    print("\n".join([
+        f"\n📊 Results Summary:",
+        f"Total Trades: {results['total_trades']}",
+        f"Win Rate: {results['win_rate']:.2%}",
+        f"Total P&L: ${results['total_pnl']:,.2f}",
+        f"Final Balance: ${results['final_balance']:,.2f}",
+        f"Max Drawdown: {results['max_drawdown']:.2%}",
+        f"Sharpe Ratio: {results['sharpe_ratio']:.2f}",
+        f"Profit Factor: {results['profit_factor']:.2f}",
+        f"Profitable Trades: {results['profitable_trades']}",
+        f"Loss Trades: {results['loss_trades']}",
+        f"Long Trades: {results['long_trades']}",
+        f"Short Trades: {results['short_trades']}",
+        f"Trading Days: {results['trading_days']}",
+        f"Value at Risk: ${results['value_at_risk']:,.2f}",
+    ]))
 
 
-def save_to_database(results: Dict[str, Any]) -> Optional[int]:
+def save_to_database(results: Dict[str, Any], service: Any = None) -> Optional[int]:
     """
     Save results to database
     
     Args:
         results: Results dictionary
+        service: Optional BacktestService to reuse (one is created if omitted)
         
     Returns:
         Backtest ID if successful, None otherwise
     """
     print("💾 Attempting to save results to database...")
+    db = None
     try:
-        from app.services.backtest_service import BacktestService
+        if service is None:
+            from app.services.backtest_service import BacktestService
+            service = BacktestService()
+        db = service.db
         
-        service = BacktestService()
         saved_backtest = service.create_backtest(results, numerate_title=True)
         backtest_id = saved_backtest.get("id")
         print(f"✅ Successfully saved to database with ID: {backtest_id}")
         return backtest_id
     except Exception as e:
         print(f"❌ Error saving to database: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Saving backtest results failed")
+        # A reused session stays unusable until the failed transaction is rolled back
+        if db is not None:
+            db.rollback()
         return None
@@ -1,9 +1,17 @@
 """
 Strategy loading and initialization
 """
-import json
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from app.backtesting.strategies import get_strategy
+from flexible.json_utils import dumps_pretty
+
+# Memoize registry lookups for sweeps. This shares nothing new: the
+# registry already hands out the same class object for a name, per-run
+# state lives on instances and the backtesting.py Strategy subclass is
+# rebuilt by build_backtest_strategy() on every run. Unknown names raise
+# and are not cached.
+_get_strategy = lru_cache(maxsize=32)(get_strategy)
 
 
 def load_and_validate_strategy(
@@ -26,7 +34,7 @@ def load_and_validate_strategy(
     """
     # Get strategy class
     try:
-        strategy_class = get_strategy(strategy_name)
+        strategy_class = _get_strategy(strategy_name)
     except ValueError as e:
         print(f"❌ {e}")
         return None
@@ -41,7 +49,7 @@ def load_and_validate_strategy(
     # Validate parameters
     if not strategy_instance.validate_parameters(strategy_instance.parameters):
         print("❌ Invalid parameters for this strategy")
-        print(f"💡 Default parameters: {json.dumps(strategy_instance.default_parameters, indent=2)}")
+        print(f"💡 Default parameters: {dumps_pretty(strategy_instance.default_parameters)}")
         return None
     
     return strategy_instance
@@ -5,6 +5,8 @@ Processes backtest trades and calculates metrics
 
 import sys
 import os
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Tuple
 
@@ -15,14 +17,67 @@ if app_dir not in sys.path:
 
 from utils.symbol_utils import symbol_to_filename
 
+# Columns of backtesting.py's trades frame that trade processing reads
+TRADE_COLUMNS = (
+    "EntryTime",
+    "ExitTime",
+    "EntryPrice",
+    "ExitPrice",
+    "Size",
+    "PnL",
+    "ReturnPct",
+    "TP",
+    "SL",
+)
+
+
+def select_trade_columns(trades_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrow the backtest trades frame to the columns trade processing uses
+    
+    Drops Duration, EntryBar, ExitBar, Tag, etc. so the array extraction
+    below touches only the needed blocks. TP/SL are kept when present.
+    """
+    return trades_df[[col for col in TRADE_COLUMNS if col in trades_df.columns]]
+
+
+def _to_utc_isoformat(times: pd.Series) -> List[str]:
+    """
+    Format naive UTC timestamps like Timestamp.tz_localize("UTC").isoformat()
+    
+    numpy's datetime_as_string formats the whole column in C, where
+    Series.dt.strftime falls back to a per-element strftime for custom
+    formats. Bar timestamps carry no sub-second part, so seconds precision
+    matches.
+    """
+    if times.empty:
+        return []
+    iso = np.datetime_as_string(times.to_numpy(dtype="datetime64[s]"), unit="s")
+    return np.char.add(iso, "+00:00").tolist()
+
+
+@lru_cache(maxsize=256)
+def _bracket_multipliers(stop_loss_pct: float, risk_reward: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stop loss / take profit price multipliers for a parameter set
+    
+    Returned as (short, long) lookup tables indexed by trade side, built
+    once per parameter combination so sweeps reuse them across runs.
+    """
+    sl_mults = np.array([1 + stop_loss_pct, 1 - stop_loss_pct])
+    tp_mults = np.array([1 - stop_loss_pct * risk_reward, 1 + stop_loss_pct * risk_reward])
+    sl_mults.flags.writeable = False
+    tp_mults.flags.writeable = False
+    return sl_mults, tp_mults
+
 
 def process_trades(
     trades_df: pd.DataFrame,
     symbol: str,
     strategy_params: Dict[str, Any]
-) -> Tuple[List[Dict], int, int, int, int, List[float]]:
+) -> Tuple[List[Dict], List[Dict], int, int, int, int, np.ndarray]:
     """
-    Process trades from backtest results
+    Process trades from backtest results and build their position drawings
     
     Args:
         trades_df: DataFrame of trades from backtesting library
@@ -30,94 +85,130 @@ def process_trades(
         strategy_params: Strategy parameters for SL/TP calculation
         
     Returns:
-        Tuple of (trades_list, profitable_trades, loss_trades, long_trades, short_trades, pnl_list)
+        Tuple of (trades_list, trade_drawings, profitable_trades, loss_trades, long_trades, short_trades, pnl)
     """
     # Normalize symbol to DB format: BTC/USDT:USDT -> BTCUSDT
     normalized_symbol = symbol_to_filename(symbol)
-    
-    trades_list = []
-    profitable_trades = 0
-    loss_trades = 0
-    long_trades = 0
-    short_trades = 0
-    pnl_list = []
-
-    for _, trade in trades_df.iterrows():
-        pnl = float(trade.PnL)
-        size = int(trade.Size)
-        entry_price = float(trade.EntryPrice)
-        pnl_list.append(pnl)
-
-        # Count trade types
-        if pnl > 0:
-            profitable_trades += 1
-        else:
-            loss_trades += 1
-
-        if size > 0:
-            long_trades += 1
-        else:
-            short_trades += 1
-
-        # Get strategy parameters for stop loss and take profit calculation
+
+    pnl = trades_df["PnL"].to_numpy(dtype=float)
+    size = trades_df["Size"].to_numpy(dtype=np.int64)
+    entry_price = trades_df["EntryPrice"].to_numpy(dtype=float)
+    exit_price = trades_df["ExitPrice"].to_numpy(dtype=float)
+    trade_count = len(trades_df)
+
+    # Count trade types
+    profitable_trades = int((pnl > 0).sum())
+    loss_trades = trade_count - profitable_trades
+    long_mask = size > 0
+    long_trades = int(long_mask.sum())
+    short_trades = trade_count - long_trades
+
+    # Prefer the order's own TP/SL levels where the backtest recorded them
+    missing = np.full(trade_count, np.nan)
+    tp = trades_df["TP"].to_numpy(dtype=float) if "TP" in trades_df.columns else missing
+    sl = trades_df["SL"].to_numpy(dtype=float) if "SL" in trades_df.columns else missing
+    tp_valid = ~np.isnan(tp)
+    sl_missing = np.isnan(sl)
+    take_profit = tp
+    stop_loss = sl
+
+    # Fall back to levels derived from strategy parameters, only when needed
+    if sl_missing.any() or not tp_valid.all():
         stop_loss_pct = strategy_params.get("stop_loss_pct", 0.02)
         risk_reward = strategy_params.get("risk_reward", 2)
+        sl_mults, tp_mults = _bracket_multipliers(stop_loss_pct, risk_reward)
+        side = long_mask.astype(np.intp)
+        take_profit = np.where(tp_valid, tp, entry_price * tp_mults[side])
+        stop_loss = np.where(sl_missing, entry_price * sl_mults[side], sl)
 
-        # Calculate stop loss and take profit based on strategy parameters
-        if size > 0:  # Long position
-            calculated_stop_loss = entry_price * (1 - stop_loss_pct)
-            calculated_take_profit = entry_price * (1 + (stop_loss_pct * risk_reward))
-        else:  # Short position
-            calculated_stop_loss = entry_price * (1 + stop_loss_pct)
-            calculated_take_profit = entry_price * (1 - (stop_loss_pct * risk_reward))
+    exit_reasons = np.where(tp_valid & (exit_price == tp), "take_profit", "stop_loss")
 
-        trade_info = {
+    # Per-trade labels and percentages, resolved column-wise up front
+    trade_types = np.where(long_mask, "long", "short")
+    position_types = np.where(long_mask, "long_position", "short_position")
+    pnl_percentage = trades_df["ReturnPct"].to_numpy(dtype=float) * 100
+
+    # Native Python lists avoid per-element numpy scalar boxing in the loop.
+    # Trades and their position drawings come out of the same pass.
+    trades_list = []
+    trade_drawings = []
+    for i, (
+        trade_pnl,
+        trade_size,
+        trade_type,
+        position_type,
+        entry,
+        exit_,
+        trade_pnl_pct,
+        entry_time,
+        exit_time,
+        trade_tp,
+        trade_sl,
+        exit_reason,
+    ) in enumerate(zip(
+        pnl.tolist(),
+        size.tolist(),
+        trade_types.tolist(),
+        position_types.tolist(),
+        entry_price.tolist(),
+        exit_price.tolist(),
+        pnl_percentage.tolist(),
+        _to_utc_isoformat(trades_df["EntryTime"]),
+        _to_utc_isoformat(trades_df["ExitTime"]),
+        take_profit.tolist(),
+        stop_loss.tolist(),
+        exit_reasons.tolist(),
+    )):
+        trades_list.append({
             "symbol": normalized_symbol,  # Use normalized symbol for DB
-            "entry_time": trade.EntryTime.tz_localize("UTC").isoformat(),
-            "exit_time": trade.ExitTime.tz_localize("UTC").isoformat(),
-            "entry_price": entry_price,
-            "exit_price": float(trade.ExitPrice),
-            "take_profit": (
-                float(trade.TP)
-                if hasattr(trade, "TP") and not pd.isna(trade.TP)
-                else calculated_take_profit
-            ),
-            "stop_loss": (
-                float(trade.SL)
-                if hasattr(trade, "SL") and not pd.isna(trade.SL)
-                else calculated_stop_loss
-            ),
-            "pnl": pnl,
-            "size": size,
-            "type": "long" if size > 0 else "short",
-            "pnl_percentage": float(trade.ReturnPct) * 100,
-            "exit_reason": (
-                "take_profit"
-                if hasattr(trade, "TP")
-                and not pd.isna(trade.TP)
-                and trade.ExitPrice == trade.TP
-                else "stop_loss"
-            ),
-        }
-        trades_list.append(trade_info)
-
-    return trades_list, profitable_trades, loss_trades, long_trades, short_trades, pnl_list
-
-
-def calculate_trading_days(trades_list: List[Dict]) -> int:
+            "entry_time": entry_time,
+            "exit_time": exit_time,
+            "entry_price": entry,
+            "exit_price": exit_,
+            "take_profit": trade_tp,
+            "stop_loss": trade_sl,
+            "pnl": trade_pnl,
+            "size": trade_size,
+            "type": trade_type,
+            "pnl_percentage": trade_pnl_pct,
+            "exit_reason": exit_reason,
+        })
+        trade_drawings.append({
+            "type": position_type,
+            "id": f"trade_{i}",
+            "ticker": normalized_symbol,  # Use normalized symbol
+            "startTime": entry_time,
+            "endTime": exit_time,
+            "entryPrice": entry,
+            "targetPrice": trade_tp,
+            "stopPrice": trade_sl,
+        })
+
+    return (
+        trades_list,
+        trade_drawings,
+        profitable_trades,
+        loss_trades,
+        long_trades,
+        short_trades,
+        pnl,
+    )
+
+
+def calculate_trading_days(trades_df: pd.DataFrame) -> int:
     """Calculate unique trading days from trades"""
-    if trades_list:
-        unique_days = set(
-            trade["entry_time"][:10] for trade in trades_list if trade["entry_time"]
-        )
-        return len(unique_days)
-    return 0
+    if trades_df.empty:
+        return 0
+    # Truncate to calendar days in numpy, then hash-count the distinct values
+    entry_days = trades_df["EntryTime"].to_numpy(dtype="datetime64[D]")
+    return len(pd.unique(entry_days))
 
 
-def calculate_value_at_risk(pnl_list: List[float]) -> float:
+def calculate_value_at_risk(pnl: np.ndarray) -> float:
     """Calculate Value at Risk (95% confidence)"""
-    if pnl_list:
-        sorted_pnl = sorted(pnl_list)
-        var_index = int(len(sorted_pnl) * 0.05)  # 5th percentile for 95% confidence
-        return abs(sorted_pnl[var_index]) if var_index < len(sorted_pnl) else 0
-    return 0
+    pnl = np.asarray(pnl, dtype=float)
+    if pnl.size == 0:
+        return 0.0
+    var_index = int(pnl.size * 0.05)  # 5th percentile for 95% confidence
+    # Partial selection (introselect) picks the same element as a full sort
+    return float(abs(np.partition(pnl, var_index)[var_index]))
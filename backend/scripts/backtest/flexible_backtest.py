@@ -4,6 +4,9 @@ Flexible Backtesting Runner
 Main entry point for flexible backtesting system
 """
 
+import json
+import logging
+import multiprocessing.util
 import sys
 import os
 
@@ -12,19 +15,11 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, "../../"))
 sys.path.insert(0, project_root)
 
-from app.db.database import Base, engine
-from flexible.cli import parse_and_handle_args
-from flexible.strategy_loader import load_and_validate_strategy
-from flexible.data_loader import load_multi_timeframe_data, check_and_scrape_data
-from flexible.backtest_runner import run_backtest
-from flexible.trade_processor import process_trades, calculate_trading_days, calculate_value_at_risk
-from flexible.drawing_creator import create_trade_drawings, create_strategy_drawings
-from flexible.strategy_overrides import apply_strategy_overrides
-from flexible.results_builder import build_results_dict, print_results_summary, save_to_database
-from flexible.chart_handler import generate_and_save_charts
-
-from typing import Dict, Any, List
-import json
+from flexible.cli import LOG_FORMAT, parse_and_handle_args
+from flexible.json_utils import dumps_pretty
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
 
 
 def run_flexible_backtest(
@@ -35,16 +30,38 @@ def run_flexible_backtest(
     cash: float = 1000000,
     save_to_db: bool = False,
     start_date: str = None,
-    end_date: str = None
+    end_date: str = None,
+    backtest_service: Any = None,
+    title_suffix: str = None
 ) -> Dict[str, Any]:
-    """Run backtest with flexible strategy and parameters"""
+    """
+    Run backtest with flexible strategy and parameters
+    
+    backtest_service lets batch callers reuse one database session for saves.
+    title_suffix tells sweep runs apart, since workers saving in parallel
+    cannot rely on title numbering to do it.
+    """
+    # Deferred so listing/info CLI commands skip the backtesting stack
+    from flexible.strategy_loader import load_and_validate_strategy
+    from flexible.data_loader import load_multi_timeframe_data, check_and_scrape_data
+    from flexible.backtest_runner import run_backtest
+    from flexible.trade_processor import (
+        select_trade_columns,
+        process_trades,
+        calculate_trading_days,
+        calculate_value_at_risk,
+    )
+    from flexible.drawing_creator import create_strategy_drawings
+    from flexible.strategy_overrides import apply_strategy_overrides
+    from flexible.results_builder import build_results_dict, print_results_summary, save_to_database
+    from flexible.chart_handler import generate_and_save_charts
     
     print(f"🚀 Flexible Backtesting System")
     print("=" * 60)
     print(f"Strategy: {strategy_name}")
     print(f"Symbol: {symbol}")
     print(f"Timeframes: {', '.join(timeframes)}")
-    print(f"Parameters: {json.dumps(parameters, indent=2)}")
+    print(f"Parameters: {dumps_pretty(parameters)}")
     print(f"Initial Cash: ${cash:,.2f}")
     if start_date and end_date:
         print(f"Date Range: {start_date} to {end_date}")
@@ -79,27 +96,32 @@ def run_flexible_backtest(
     if data_dict is None:
         return None
     
+    # Main timeframe drives the engine and the result date range
+    main_data = data_dict[timeframes[0]]
+    
     # Run backtest
-    stats, bt = run_backtest(strategy_instance, data_dict, timeframes, cash)
+    stats, bt = run_backtest(strategy_instance, data_dict, main_data, cash)
     if stats is None:
         return None
     
-    # Use main timeframe data
-    main_timeframe = timeframes[0]
-    main_data = data_dict[main_timeframe]
-    
     # Process trades
-    trades_list, profitable_trades, loss_trades, long_trades, short_trades, pnl_list = process_trades(
-        stats._trades, symbol, strategy_instance.parameters
-    )
+    trades_df = select_trade_columns(stats._trades)
+    (
+        trades_list,
+        trade_drawings,
+        profitable_trades,
+        loss_trades,
+        long_trades,
+        short_trades,
+        pnl,
+    ) = process_trades(trades_df, symbol, strategy_instance.parameters)
     
     # Calculate metrics
-    trading_days = calculate_trading_days(trades_list)
-    value_at_risk = calculate_value_at_risk(pnl_list)
+    trading_days = calculate_trading_days(trades_df)
+    value_at_risk = calculate_value_at_risk(pnl)
     
     # Create drawings
-    drawings = create_trade_drawings(trades_list, symbol)
-    drawings = create_strategy_drawings(strategy_instance, bt, symbol, drawings)
+    drawings = create_strategy_drawings(strategy_instance, bt, symbol, trade_drawings)
     
     # Get strategy-specific fields
     strategy_related_fields = []
@@ -124,12 +146,13 @@ def run_flexible_backtest(
         drawings=drawings,
         main_data=main_data,
         cash=cash,
-        strategy_related_fields=strategy_related_fields
+        strategy_related_fields=strategy_related_fields,
+        title_suffix=title_suffix
     )
     
     # Save to database and generate charts if requested
     if save_to_db:
-        backtest_id = save_to_database(results)
+        backtest_id = save_to_database(results, backtest_service)
         if backtest_id:
             results["id"] = backtest_id
             results = generate_and_save_charts(strategy_instance, backtest_id, results)
@@ -140,16 +163,168 @@ def run_flexible_backtest(
     return results
 
 
+# One BacktestService (and database session) per batch worker process
+_worker_backtest_service = None
+
+
+def _run_batch_config(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Worker entry point for batch runs (module level so it can be pickled)"""
+    global _worker_backtest_service
+    
+    if config.get("save_to_db"):
+        if _worker_backtest_service is None:
+            from app.services.backtest_service import BacktestService
+            _worker_backtest_service = BacktestService()
+            # Close the session when the worker process exits
+            multiprocessing.util.Finalize(
+                None, _worker_backtest_service.db.close, exitpriority=10
+            )
+        return run_flexible_backtest(**config, backtest_service=_worker_backtest_service)
+    
+    return run_flexible_backtest(**config)
+
+
+def _init_batch_worker(log_level: int):
+    """
+    Prepare a batch worker process
+    
+    Gives the worker the parent's log level (spawned workers start
+    unconfigured) and drops database connections inherited from the
+    parent on fork, so the worker opens its own.
+    """
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    
+    database = sys.modules.get("app.db.database")
+    if database is not None:
+        # close=False leaves the parent's connections usable by the parent
+        database.engine.dispose(close=False)
+
+
+def run_flexible_backtest_batch(
+    configs: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run many independent backtests in parallel across CPU cores
+    
+    Args:
+        configs: List of run_flexible_backtest keyword argument dicts
+        max_workers: Number of worker processes (defaults to CPU count)
+        
+    Returns:
+        Results in the same order as configs, None for failed runs
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_batch_worker,
+        initargs=(logging.getLogger().level,),
+    ) as executor:
+        futures = {
+            executor.submit(_run_batch_config, config): index
+            for index, config in enumerate(configs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                print(f"❌ Backtest {index + 1}/{len(configs)} failed: {e}")
+    
+    return results
+
+
+def format_parameter_label(parameters: Dict[str, Any]) -> Optional[str]:
+    """Format a sweep parameter set as a title label (e.g. [fast_ma=5, slow_ma=20])"""
+    if not parameters:
+        return None
+    return "[" + ", ".join(f"{name}={value}" for name, value in parameters.items()) + "]"
+
+
+def build_sweep_configs(
+    config: Dict[str, Any],
+    parameter_sweep: Optional[List[Dict[str, Any]]],
+    symbol_sweep: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    """
+    Expand a base configuration into one run per symbol and parameter set
+    
+    Args:
+        config: Base run_flexible_backtest configuration
+        parameter_sweep: Parameter sets layered on top of config["parameters"]
+        symbol_sweep: Symbols to run (defaults to config["symbol"])
+        
+    Returns:
+        List of run_flexible_backtest keyword argument dicts
+    """
+    # Titles carry the swept parameters so parallel saves never collide
+    return [
+        {
+            **config,
+            "symbol": symbol,
+            "parameters": {**config["parameters"], **parameters},
+            "title_suffix": format_parameter_label(parameters),
+        }
+        for symbol in symbol_sweep or [config["symbol"]]
+        for parameters in parameter_sweep or [{}]
+    ]
+
+
+def print_sweep_ranking(
+    configs: List[Dict[str, Any]],
+    results: List[Optional[Dict[str, Any]]]
+):
+    """Print completed sweep runs ranked by total P&L"""
+    ranked = sorted(
+        (
+            (result["total_pnl"], config["symbol"], config["parameters"], result)
+            for config, result in zip(configs, results)
+            if result is not None
+        ),
+        key=lambda row: row[0],
+        reverse=True,
+    )
+    if not ranked:
+        return
+    
+    lines = ["\n🏆 Ranking by Total P&L:"]
+    for rank, (total_pnl, symbol, parameters, result) in enumerate(ranked, start=1):
+        lines.append(
+            f"{rank:>3}. {symbol:<12} P&L: ${total_pnl:>14,.2f}  "
+            f"Win Rate: {result['win_rate']:>7.2%}  "
+            f"Sharpe: {result['sharpe_ratio']:>6.2f}  "
+            f"Params: {json.dumps(parameters, sort_keys=True)}"
+        )
+    print("\n".join(lines))
+
+
 def main():
     """Main entry point"""
-    # Create database tables if they don't exist
-    Base.metadata.create_all(bind=engine)
-    
     # Parse arguments and handle commands
     config = parse_and_handle_args()
     if config is None:
         return
     
+    # Create database tables if they don't exist (only needed when saving)
+    if config["save_to_db"]:
+        from app.db.database import Base, engine
+        Base.metadata.create_all(bind=engine)
+    
+    # Run a parameter and/or symbol sweep when requested
+    parameter_sweep = config.pop("parameter_sweep", None)
+    symbol_sweep = config.pop("symbol_sweep", None)
+    if parameter_sweep or symbol_sweep:
+        configs = build_sweep_configs(config, parameter_sweep, symbol_sweep)
+        results = run_flexible_backtest_batch(configs)
+        
+        completed = sum(1 for result in results if result is not None)
+        print(f"\n✅ Completed {completed}/{len(configs)} backtests")
+        print_sweep_ranking(configs, results)
+        if completed == 0:
+            sys.exit(1)
+        return
+    
     # Run backtest
     results = run_flexible_backtest(**config)
     
@@ -7,6 +7,7 @@ CLI tool for scraping historical market data from exchanges
 import asyncio
 import sys
 import os
+from typing import Any, Dict, List, Optional
 from colorama import Fore
 
 # Add project root to Python path
@@ -19,10 +20,20 @@ from app.backtesting.scraper.config import RESET_COLOR, SUCCESS_COLOR
 from cli import parse_and_handle_args
 
 
-async def run_scraper():
-    """Run the scraper with parsed arguments"""
+async def run_scraper(param_sets: Optional[List[Dict[str, Any]]] = None) -> bool:
+    """
+    Run the scraper with parsed arguments
+    
+    Args:
+        param_sets: Parameter sets to scrape; parsed from the command line
+            when omitted, so other Python code can scrape in-process
+    
+    Returns:
+        True if every symbol was scraped successfully
+    """
     # Parse arguments and get parameter sets
-    param_sets = parse_and_handle_args()
+    if param_sets is None:
+        param_sets = parse_and_handle_args()
     
     # Display summary
     first_param = param_sets[0]
@@ -38,17 +49,24 @@ async def run_scraper():
     print("=" * 50)
     
     # Process each symbol sequentially
+    all_succeeded = True
     for param_set in param_sets:
         print(
             f"\n{Fore.MAGENTA}Processing {param_set['symbol'].upper()}...{RESET_COLOR}"
         )
-        await fetch_and_save_historical_data(param_set)
-        print(f"{SUCCESS_COLOR}Completed {param_set['symbol'].upper()}{RESET_COLOR}")
+        if await fetch_and_save_historical_data(param_set):
+            print(f"{SUCCESS_COLOR}Completed {param_set['symbol'].upper()}{RESET_COLOR}")
+        else:
+            all_succeeded = False
+    
+    return all_succeeded
 
 
 def main():
     """Main entry point"""
-    asyncio.run(run_scraper())
+    # Exit status reflects the scrape so shell callers can react to failures
+    if not asyncio.run(run_scraper()):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
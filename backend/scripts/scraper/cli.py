@@ -2,14 +2,16 @@
 CLI argument parsing for CCXT scraper
 """
 import argparse
+from functools import lru_cache
 import sys
 from typing import Dict, Any, List, Optional
 from app.backtesting.scraper import Timeframe
 from app.backtesting.scraper.config import WARNING_LABEL, RESET_COLOR
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure argument parser"""
+    """Create and configure argument parser (built once, parsing never mutates it)"""
     parser = argparse.ArgumentParser(
         description="CCXT Historical Data Scraper",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -97,15 +99,18 @@ def parse_symbols(symbol_str: str) -> List[str]:
     return [s.strip().upper() for s in symbol_str.split(",")]
 
 
-def parse_and_handle_args() -> List[Dict[str, Any]]:
+def parse_and_handle_args(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
     """
     Parse command line arguments and return scraping configurations
     
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
     Returns:
         List of parameter sets for scraping
     """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Parse arguments
     symbols = parse_symbols(args.symbol)
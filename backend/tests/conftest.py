@@ -0,0 +1,13 @@
+"""
+Pytest configuration
+Makes the backend and the backtest scripts importable from the tests
+"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+for path in (BACKEND_DIR, os.path.join(BACKEND_DIR, "scripts", "backtest")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,116 @@
+"""
+Tests for the flexible backtest CLI parsing and sweep fan-out
+"""
+
+import json
+
+import pytest
+
+from flexible.cli import parse_and_handle_args, parse_param_grid, parse_symbols, parse_sweep_file
+from flexible_backtest import build_sweep_configs, format_parameter_label
+
+
+def test_param_grid_expands_every_combination():
+    parameter_sets = parse_param_grid('{"fast_ma": [5, 10], "slow_ma": [20, 30, 40]}')
+
+    assert parameter_sets == [
+        {"fast_ma": 5, "slow_ma": 20},
+        {"fast_ma": 5, "slow_ma": 30},
+        {"fast_ma": 5, "slow_ma": 40},
+        {"fast_ma": 10, "slow_ma": 20},
+        {"fast_ma": 10, "slow_ma": 30},
+        {"fast_ma": 10, "slow_ma": 40},
+    ]
+
+
+@pytest.mark.parametrize("grid", [
+    "{}",
+    "[1, 2]",
+    '{"fast_ma": 5}',
+    '{"fast_ma": []}',
+    '{"fast_ma": [5], "slow_ma": "20"}',
+    "not json",
+])
+def test_param_grid_rejects_invalid_grids(grid):
+    with pytest.raises(SystemExit) as exc_info:
+        parse_param_grid(grid)
+    assert exc_info.value.code == 1
+
+
+@pytest.mark.parametrize("content", ['{"fast_ma": 5}', '[{"fast_ma": 5}, 3]', "not json"])
+def test_sweep_file_rejects_non_list_of_objects(tmp_path, content):
+    sweep_path = tmp_path / "sweep.json"
+    sweep_path.write_text(content)
+
+    with pytest.raises(SystemExit):
+        parse_sweep_file(str(sweep_path))
+
+
+def test_sweep_file_and_param_grid_combine(tmp_path):
+    sweep_path = tmp_path / "sweep.json"
+    sweep_path.write_text(json.dumps([{"fast_ma": 3, "slow_ma": 9}, {"fast_ma": 5, "slow_ma": 20}]))
+
+    config = parse_and_handle_args([
+        "--strategy", "simple_ma_cross",
+        "--sweep", str(sweep_path),
+        "--param-grid", '{"fast_ma": [5, 10], "slow_ma": [20]}',
+    ])
+
+    # The set listed in both is only run once
+    assert config["parameter_sweep"] == [
+        {"fast_ma": 3, "slow_ma": 9},
+        {"fast_ma": 5, "slow_ma": 20},
+        {"fast_ma": 10, "slow_ma": 20},
+    ]
+
+
+def test_parse_symbols_dedupes_and_keeps_order():
+    assert parse_symbols(" BTCUSDT,ETHUSDT,,BTCUSDT , SOLUSDT ") == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+
+def test_symbols_become_a_symbol_sweep():
+    config = parse_and_handle_args(["--strategy", "simple_ma_cross", "--symbols", "BTCUSDT,ETHUSDT,BTCUSDT"])
+
+    assert config["symbol"] == "BTCUSDT"
+    assert config["symbol_sweep"] == ["BTCUSDT", "ETHUSDT"]
+
+
+@pytest.mark.parametrize("symbols", ["", ",", " , "])
+def test_empty_symbol_is_an_error(symbols, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        parse_and_handle_args(["--strategy", "simple_ma_cross", "--symbol", symbols])
+
+    assert exc_info.value.code == 1
+    assert "at least one symbol" in capsys.readouterr().out
+
+
+def test_format_parameter_label():
+    assert format_parameter_label({}) is None
+    assert format_parameter_label({"fast_ma": 5, "slow_ma": 20}) == "[fast_ma=5, slow_ma=20]"
+
+
+def test_sweep_configs_have_distinct_titles():
+    config = parse_and_handle_args([
+        "--strategy", "simple_ma_cross",
+        "--symbols", "BTCUSDT,ETHUSDT",
+        "--params", '{"risk_reward": 3}',
+        "--param-grid", '{"fast_ma": [5, 10], "slow_ma": [20, 30]}',
+    ])
+
+    configs = build_sweep_configs(config, config.pop("parameter_sweep"), config.pop("symbol_sweep"))
+
+    assert len(configs) == 8
+    assert len({(c["symbol"], c["title_suffix"]) for c in configs}) == 8
+    # Swept values override --params, which still applies to every run
+    assert all(c["parameters"]["risk_reward"] == 3 for c in configs)
+    assert configs[1]["parameters"] == {"risk_reward": 3, "fast_ma": 5, "slow_ma": 30}
+    assert configs[1]["title_suffix"] == "[fast_ma=5, slow_ma=30]"
+
+
+def test_symbol_only_sweep_keeps_plain_titles():
+    config = parse_and_handle_args(["--strategy", "simple_ma_cross", "--symbols", "BTCUSDT,ETHUSDT"])
+
+    configs = build_sweep_configs(config, None, config.pop("symbol_sweep"))
+
+    assert [c["symbol"] for c in configs] == ["BTCUSDT", "ETHUSDT"]
+    assert {c["title_suffix"] for c in configs} == {None}
@@ -0,0 +1,86 @@
+"""
+Tests for the flexible backtest data loader
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from flexible import data_loader
+
+
+def write_ohlcv_csv(path, rows):
+    """Write (date, open, high, low, close, volume) rows as a chart CSV"""
+    frame = pd.DataFrame(rows, columns=data_loader.OHLCV_COLUMNS)
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def ohlcv_csv(tmp_path):
+    return write_ohlcv_csv(tmp_path / "BTCUSDT-1h-bybit.csv", [
+        ("2024-01-01 00:00:00", 100.0, 110.0, 90.0, 105.0, 10.0),
+        ("2024-01-01 01:00:00", 105.0, 115.0, 95.0, 110.0, 20.0),
+        ("2024-01-01 02:00:00", 110.0, 120.0, 100.0, 115.0, 30.0),
+    ])
+
+
+@pytest.fixture(autouse=True)
+def empty_frame_cache():
+    data_loader._ohlcv_cache.clear()
+    yield
+    data_loader._ohlcv_cache.clear()
+
+
+def test_load_ohlcv_reuses_cached_frame(ohlcv_csv):
+    first = data_loader._load_ohlcv(ohlcv_csv)
+    second = data_loader._load_ohlcv(ohlcv_csv)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert list(data_loader._ohlcv_cache) == [ohlcv_csv]
+
+
+def test_load_ohlcv_mutation_does_not_leak(ohlcv_csv):
+    data = data_loader._load_ohlcv(ohlcv_csv)
+    data["Signal"] = 1.0
+    data.loc[data.index[0], "Close"] = -1.0
+    data["Open"].to_numpy()[:] = np.nan
+
+    reloaded = data_loader._load_ohlcv(ohlcv_csv)
+
+    assert "Signal" not in reloaded.columns
+    assert reloaded["Close"].tolist() == [105.0, 110.0, 115.0]
+    assert reloaded["Open"].tolist() == [100.0, 105.0, 110.0]
+
+
+def test_read_ohlcv_csv_fills_missing_volume(tmp_path):
+    filepath = write_ohlcv_csv(tmp_path / "ETHUSDT-1h-bybit.csv", [
+        ("2024-01-01 00:00:00", 100.0, 110.0, 90.0, 105.0, np.nan),
+        ("2024-01-01 01:00:00", 105.0, 115.0, 95.0, 110.0, 20.0),
+    ])
+
+    data = data_loader._read_ohlcv_csv(filepath)
+
+    assert data["Volume"].tolist() == [0.0, 20.0]
+
+
+@pytest.mark.parametrize("close", [np.nan, np.inf, 0.0, -5.0])
+def test_read_ohlcv_csv_rejects_bad_prices(tmp_path, close):
+    filepath = write_ohlcv_csv(tmp_path / "SOLUSDT-1h-bybit.csv", [
+        ("2024-01-01 00:00:00", 100.0, 110.0, 90.0, 105.0, 10.0),
+        ("2024-01-01 01:00:00", 105.0, 115.0, 95.0, close, 20.0),
+    ])
+
+    with pytest.raises(ValueError, match="in OHLCV data"):
+        data_loader._read_ohlcv_csv(filepath)
+
+
+def test_validate_ohlcv_selects_prices_by_name():
+    # Volume first: a positional price slice would check it instead of Close
+    data = pd.DataFrame(
+        {"Volume": [0.0], "Open": [1.0], "High": [1.0], "Low": [1.0], "Close": [0.0]},
+        index=pd.to_datetime(["2024-01-01"]),
+    )
+
+    with pytest.raises(ValueError, match="Non-positive price"):
+        data_loader._validate_ohlcv(data, "test.csv")
@@ -0,0 +1,60 @@
+"""
+Tests for the strided RSI pivot detection of the RSI + MACD combo strategy
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtesting.strategies.rsi_macd_combo.indicators import (
+    calculate_bear_pivots,
+    calculate_bull_pivots,
+    calculate_rsi,
+)
+
+
+def reference_pivots(rsi_values, extremum):
+    """The per-bar window scan the strided version replaced"""
+    pivots = np.full(len(rsi_values), np.nan)
+    for i in range(5, len(rsi_values) - 5):
+        window = rsi_values[i - 5:i + 6]
+        if rsi_values[i] == extremum(window):
+            pivots[i] = rsi_values[i]
+    return pivots
+
+
+def assert_pivots_match(rsi_values):
+    rsi_values = np.asarray(rsi_values, dtype=float)
+    np.testing.assert_array_equal(
+        calculate_bull_pivots(rsi_values), reference_pivots(rsi_values, np.min)
+    )
+    np.testing.assert_array_equal(
+        calculate_bear_pivots(rsi_values), reference_pivots(rsi_values, np.max)
+    )
+
+
+def test_pivots_match_reference_on_rsi_series():
+    rng = np.random.default_rng(3)
+    close = pd.Series(100 + np.cumsum(rng.normal(size=400)))
+    rsi_values = calculate_rsi(close, 14)
+
+    assert_pivots_match(rsi_values)
+    assert np.isfinite(calculate_bull_pivots(rsi_values)).any()
+    assert np.isfinite(calculate_bear_pivots(rsi_values)).any()
+
+
+@pytest.mark.parametrize("rsi_values", [
+    # Plateaus: every bar equal to the window extremum is a pivot
+    [50.0] * 15,
+    [40.0, 45.0, 50.0, 30.0, 30.0, 30.0, 50.0, 55.0, 70.0, 70.0, 60.0, 50.0, 40.0, 45.0],
+    # NaN warm-up and gaps never produce pivots around them
+    [np.nan] * 6 + [30.0, 40.0, 20.0, 50.0, 60.0, 40.0, 35.0, 45.0, 50.0, 55.0, 60.0, 65.0],
+    [30.0, 40.0, 50.0, 60.0, 70.0, np.nan, 70.0, 60.0, 50.0, 40.0, 30.0, 20.0],
+    # Array boundaries: shorter than, equal to and one past the 11-bar window
+    [],
+    [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 50.0, 40.0, 30.0, 20.0],
+    [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 50.0, 40.0, 30.0, 20.0, 10.0],
+    [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 50.0, 40.0, 30.0, 20.0, 10.0, 5.0],
+])
+def test_pivots_match_reference_on_edges(rsi_values):
+    assert_pivots_match(rsi_values)
@@ -0,0 +1,68 @@
+"""
+Tests for the precomputed SimpleMACross crossover signals
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting.lib import crossover
+
+from app.backtesting.strategies.simple_ma_cross.strategy_class import compute_cross_signals
+
+
+def reference_signals(fast, slow):
+    """The per-bar crossover() calls next() made before signals were precomputed"""
+    signals = []
+    for i in range(len(fast)):
+        fast_history, slow_history = list(fast[:i + 1]), list(slow[:i + 1])
+        if crossover(fast_history, slow_history):
+            signals.append(1)
+        elif crossover(slow_history, fast_history):
+            signals.append(-1)
+        else:
+            signals.append(0)
+    return signals
+
+
+def moving_averages(close, fast_ma, slow_ma):
+    close_series = pd.Series(close)
+    return (
+        close_series.rolling(fast_ma).mean().to_numpy(),
+        close_series.rolling(slow_ma).mean().to_numpy(),
+    )
+
+
+@pytest.mark.parametrize("fast_ma, slow_ma", [(3, 8), (5, 20), (1, 2)])
+def test_signals_match_crossover_on_price_series(fast_ma, slow_ma):
+    # Random walk with flat stretches, NaN warm-up comes from the rolling windows
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(size=300))
+    close[120:140] = close[119]
+    fast, slow = moving_averages(close, fast_ma, slow_ma)
+
+    signals = compute_cross_signals(fast, slow)
+
+    assert signals.dtype == np.int8
+    assert signals.tolist() == reference_signals(fast, slow)
+    assert (signals != 0).any()
+
+
+@pytest.mark.parametrize("fast, slow", [
+    # Touching without crossing, and crossing through an equal bar
+    ([1.0, 2.0, 2.0, 1.0, 2.0, 3.0], [2.0, 2.0, 2.0, 2.0, 2.0, 2.0]),
+    ([3.0, 2.0, 2.0, 3.0, 1.0], [2.0, 2.0, 2.0, 2.0, 2.0]),
+    # Equal series never cross
+    ([1.0, 1.0, 1.0], [1.0, 1.0, 1.0]),
+    # NaN warm-up: a cross out of NaN is not a cross
+    ([np.nan, np.nan, 1.0, 3.0, 1.0], [np.nan, 2.0, 2.0, 2.0, 2.0]),
+    ([np.nan, 3.0, 1.0], [np.nan, np.nan, 2.0]),
+    # Array boundaries: crosses on the last bar, too short to cross
+    ([1.0, 3.0], [2.0, 2.0]),
+    ([3.0, 1.0], [2.0, 2.0]),
+    ([1.0], [2.0]),
+    ([], []),
+])
+def test_signals_match_crossover_on_edges(fast, slow):
+    fast, slow = np.array(fast, dtype=float), np.array(slow, dtype=float)
+
+    assert compute_cross_signals(fast, slow).tolist() == reference_signals(fast, slow)
@@ -0,0 +1,200 @@
+"""
+Tests for the ticker snapshot handling
+"""
+
+import pytest
+
+try:
+    from app.services.exchange import ticker_handler
+    from app.services.exchange.ticker_handler import TickerHandler, tickers_to_records
+except RuntimeError as e:  # app.core.cache connects to Redis on import
+    pytest.skip(f"Redis unavailable: {e}", allow_module_level=True)
+
+
+class FakeExchange:
+    """Exchange with loaded markets and a ticker source honouring symbol lists"""
+
+    def __init__(self, markets, tickers=None):
+        self.markets = markets
+        self.tickers = tickers or {}
+
+    def fetch_tickers(self, symbols=None):
+        if symbols is None:
+            return dict(self.tickers)
+        return {symbol: self.tickers[symbol] for symbol in symbols if symbol in self.tickers}
+
+
+MARKETS = {
+    "BTC/USDT:USDT": {"swap": True, "quote": "USDT"},
+    "ETH/USDC:USDC": {"swap": True, "quote": "USDC"},
+    "BTC/USDT": {"swap": False, "quote": "USDT"},
+}
+
+
+def make_ticker(symbol, base, quote, last, volume=1.0):
+    """Ticker usable both as a CCXT ticker (baseVolume) and a formatted one (volume)"""
+    return {
+        "symbol": symbol,
+        "base": base,
+        "quote": quote,
+        "last": last,
+        "baseVolume": volume,
+        "volume": volume,
+        "quoteVolume": volume * last,
+    }
+
+
+def test_ticker_symbols_fetch_every_market_by_default(monkeypatch):
+    monkeypatch.setattr(ticker_handler.settings, "TICKER_QUOTE_CURRENCY", "")
+
+    assert TickerHandler(FakeExchange(MARKETS))._ticker_symbols() is None
+
+
+def test_ticker_symbols_restrict_to_configured_quote(monkeypatch):
+    monkeypatch.setattr(ticker_handler.settings, "TICKER_QUOTE_CURRENCY", "usdt")
+
+    assert TickerHandler(FakeExchange(MARKETS))._ticker_symbols() == ["BTC/USDT:USDT"]
+
+
+def test_non_usdt_quote_filter_returns_tickers(monkeypatch):
+    monkeypatch.setattr(ticker_handler.settings, "TICKER_QUOTE_CURRENCY", "")
+    exchange = FakeExchange(MARKETS, {
+        "BTC/USDT:USDT": make_ticker("BTC/USDT:USDT", "BTC", "USDT", 60000.0),
+        "ETH/USDC:USDC": make_ticker("ETH/USDC:USDC", "ETH", "USDC", 3000.0),
+    })
+    handler = TickerHandler(exchange)
+
+    # Same steps as fetch_all_tickers, minus the shared cache
+    records = handler._store_snapshot(
+        handler._format_tickers(exchange.fetch_tickers(handler._ticker_symbols()))
+    )
+    filtered = handler.filter_and_sort_tickers(records, quote_currency="USDC")
+
+    assert filtered["symbol"].tolist() == ["ETH/USDC"]
+
+
+# Snapshot exercising ties, missing values, zero prices and mixed case
+SNAPSHOT = [
+    {"symbol": "BTC/USDT", "base": "BTC", "quote": "USDT", "last": 60000.0, "volume": 10.0,
+     "quoteVolume": 600000.0, "change": 100.0, "percentage": 1.5, "timestamp": 1700000000000},
+    {"symbol": "ETH/USDT", "base": "ETH", "quote": "USDT", "last": 3000.0, "volume": 10.0,
+     "quoteVolume": None, "change": -20.0, "percentage": -0.5, "timestamp": 1700000000001},
+    {"symbol": "eth/usdc", "base": "eth", "quote": "USDC", "last": 3000.0, "volume": None,
+     "quoteVolume": 5000.0, "change": None, "percentage": 1.5, "timestamp": None},
+    {"symbol": "SOL/USDT", "base": "SOL", "quote": "USDT", "last": None, "volume": 50.0,
+     "quoteVolume": 7000.0, "change": 0.0, "percentage": None, "timestamp": 1700000000002},
+    {"symbol": "DOGE/USDT", "base": "DOGE", "quote": "USDT", "last": 0.0, "volume": 10.0,
+     "quoteVolume": 7000.0, "change": 0.0, "percentage": 3.0, "timestamp": 1700000000003},
+    {"symbol": "ADA/USDT", "base": "ADA", "quote": "USDT", "last": 0.5, "volume": 5.0,
+     "quoteVolume": 2.5, "change": 0.01, "percentage": 3.0, "timestamp": 1700000000004},
+]
+
+
+def reference_filter_and_sort(tickers, search=None, quote_currency="USDT",
+                              sort_by="last", sort_order="desc"):
+    """The list-of-dicts implementation the record array version replaced"""
+    filtered = list(tickers)
+    if search:
+        search_lower = search.lower()
+        filtered = [
+            ticker for ticker in filtered
+            if search_lower in (ticker["symbol"] or "").lower()
+            or search_lower in (ticker["base"] or "").lower()
+            or search_lower in (ticker["quote"] or "").lower()
+        ]
+    if quote_currency:
+        filtered = [ticker for ticker in filtered if ticker["quote"] == quote_currency.upper()]
+
+    reverse = sort_order.lower() == "desc"
+    if sort_by in ticker_handler.NUMERIC_SORT_FIELDS:
+        def key(ticker):
+            value = ticker[sort_by]
+            if value is None:
+                return 0 if reverse else float("inf")
+            return value
+    elif sort_by == "symbol":
+        def key(ticker):
+            return ticker["symbol"] or ""
+    elif sort_by == "volumePriceRatio":
+        def key(ticker):
+            price = ticker["last"]
+            return (ticker["volume"] or 0) / price if price and price > 0 else 0
+    else:
+        return filtered
+    return sorted(filtered, key=key, reverse=reverse)
+
+
+@pytest.fixture
+def snapshot_handler():
+    handler = TickerHandler(FakeExchange({}))
+    handler._store_snapshot(tickers_to_records(SNAPSHOT))
+    return handler
+
+
+def test_records_round_trip_keeps_missing_values():
+    tickers = SNAPSHOT + [{"symbol": "XRP/USDT", "base": None, "quote": "USDT",
+                           "last": float("nan"), "percentage": float("nan")}]
+
+    round_tripped = ticker_handler.records_to_tickers(tickers_to_records(tickers))
+
+    for original, result in zip(tickers, round_tripped):
+        assert set(result) == set(ticker_handler.TICKER_DTYPE.names)
+        for name in ticker_handler.TICKER_DTYPE.names:
+            value = original.get(name)
+            if value is None or value != value:  # None or NaN
+                assert result[name] is None, name
+            else:
+                assert result[name] == value, name
+    assert isinstance(round_tripped[0]["timestamp"], int)
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize("sort_by", ticker_handler.SORT_FIELDS)
+def test_sort_matches_reference(snapshot_handler, sort_by, sort_order):
+    expected = reference_filter_and_sort(
+        ticker_handler.records_to_tickers(tickers_to_records(SNAPSHOT)),
+        quote_currency=None, sort_by=sort_by, sort_order=sort_order,
+    )
+
+    # Precomputed snapshot orders and on-the-fly orders must agree
+    for tickers in (snapshot_handler._cached_tickers, tickers_to_records(SNAPSHOT)):
+        result = snapshot_handler.filter_and_sort_tickers(
+            tickers, quote_currency=None, sort_by=sort_by, sort_order=sort_order
+        )
+        assert [t["symbol"] for t in ticker_handler.records_to_tickers(result)] == [
+            t["symbol"] for t in expected
+        ]
+
+
+@pytest.mark.parametrize("search, expected", [
+    ("eth", ["ETH/USDT", "eth/usdc"]),
+    ("ETH", ["ETH/USDT", "eth/usdc"]),
+    ("usdc", ["eth/usdc"]),
+    ("/us", ["BTC/USDT", "ETH/USDT", "eth/usdc", "SOL/USDT", "DOGE/USDT", "ADA/USDT"]),
+    ("Doge", ["DOGE/USDT"]),
+    ("xyz", []),
+])
+def test_search_is_case_insensitive_across_fields(snapshot_handler, search, expected):
+    result = snapshot_handler.filter_and_sort_tickers(
+        snapshot_handler._cached_tickers, search=search, quote_currency=None,
+        sort_by="unsorted",
+    )
+
+    assert result["symbol"].tolist() == expected
+
+
+@pytest.mark.parametrize("page", [1, 2, 3])
+@pytest.mark.parametrize("sort_by", ["quoteVolume", "volumePriceRatio", "symbol"])
+def test_response_page_matches_reference(snapshot_handler, sort_by, page):
+    args = dict(search="t", quote_currency="USDT", sort_by=sort_by, sort_order="desc")
+    reference = reference_filter_and_sort(
+        ticker_handler.records_to_tickers(tickers_to_records(SNAPSHOT)), **args
+    )
+    expected = ticker_handler.Paginator.create_response(
+        items=reference, page=page, page_size=2, filters=args, items_key="tickers"
+    )
+
+    filtered = snapshot_handler.filter_and_sort_tickers(snapshot_handler._cached_tickers, **args)
+    response = snapshot_handler.build_ticker_response(filtered, page, 2, **args)
+
+    assert response == expected
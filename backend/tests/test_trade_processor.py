@@ -0,0 +1,148 @@
+"""
+Tests for backtest trade processing
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from flexible.trade_processor import (
+    calculate_trading_days,
+    calculate_value_at_risk,
+    process_trades,
+    select_trade_columns,
+)
+
+
+@pytest.fixture
+def trades_df():
+    """Trades frame shaped like backtesting.py's stats._trades"""
+    return pd.DataFrame({
+        "Size": [2, -3, 1],
+        "EntryBar": [0, 5, 9],
+        "ExitBar": [2, 7, 11],
+        "EntryPrice": [100.0, 200.0, 50.0],
+        "ExitPrice": [110.0, 210.0, 49.0],
+        "SL": [95.0, np.nan, np.nan],
+        "TP": [110.0, np.nan, 60.0],
+        "PnL": [20.0, -30.0, -1.0],
+        "ReturnPct": [0.1, -0.05, -0.02],
+        "EntryTime": pd.to_datetime(["2024-01-01 10:00", "2024-01-02 08:00", "2024-01-02 23:00"]),
+        "ExitTime": pd.to_datetime(["2024-01-01 12:00", "2024-01-02 10:00", "2024-01-03 01:00"]),
+        "Duration": pd.to_timedelta(["2h", "2h", "2h"]),
+        "Tag": [None, None, None],
+    })
+
+
+def test_select_trade_columns_drops_unused_columns(trades_df):
+    selected = select_trade_columns(trades_df)
+
+    assert "Duration" not in selected.columns
+    assert "Tag" not in selected.columns
+    assert {"TP", "SL", "PnL", "EntryTime"} <= set(selected.columns)
+
+
+def test_process_trades(trades_df):
+    params = {"stop_loss_pct": 0.05, "risk_reward": 2}
+
+    (
+        trades_list,
+        trade_drawings,
+        profitable_trades,
+        loss_trades,
+        long_trades,
+        short_trades,
+        pnl,
+    ) = process_trades(select_trade_columns(trades_df), "BTC/USDT:USDT", params)
+
+    assert (profitable_trades, loss_trades, long_trades, short_trades) == (1, 2, 2, 1)
+    assert pnl.tolist() == [20.0, -30.0, -1.0]
+
+    long_tp, short_sl, fallback_sl = trades_list
+    # Recorded TP/SL are used as is; a fill at the TP is a take profit
+    assert long_tp == {
+        "symbol": "BTCUSDT",
+        "entry_time": "2024-01-01T10:00:00+00:00",
+        "exit_time": "2024-01-01T12:00:00+00:00",
+        "entry_price": 100.0,
+        "exit_price": 110.0,
+        "take_profit": 110.0,
+        "stop_loss": 95.0,
+        "pnl": 20.0,
+        "size": 2,
+        "type": "long",
+        "pnl_percentage": pytest.approx(10.0),
+        "exit_reason": "take_profit",
+    }
+    # Missing levels of a short fall back to the inverted parameter brackets
+    assert short_sl["type"] == "short"
+    assert short_sl["size"] == -3
+    assert short_sl["take_profit"] == pytest.approx(180.0)
+    assert short_sl["stop_loss"] == pytest.approx(210.0)
+    assert short_sl["exit_reason"] == "stop_loss"
+    # Only the missing SL of a long falls back, the recorded TP is kept
+    assert fallback_sl["take_profit"] == 60.0
+    assert fallback_sl["stop_loss"] == pytest.approx(47.5)
+    assert fallback_sl["exit_reason"] == "stop_loss"
+    assert fallback_sl["exit_time"] == "2024-01-03T01:00:00+00:00"
+
+    # Timestamps match pandas' UTC isoformat
+    for trade, (_, row) in zip(trades_list, trades_df.iterrows()):
+        assert trade["entry_time"] == row.EntryTime.tz_localize("UTC").isoformat()
+        assert trade["exit_time"] == row.ExitTime.tz_localize("UTC").isoformat()
+
+    # One position drawing per trade, with the trade's levels
+    assert [drawing["type"] for drawing in trade_drawings] == [
+        "long_position", "short_position", "long_position",
+    ]
+    for i, (trade, drawing) in enumerate(zip(trades_list, trade_drawings)):
+        assert drawing == {
+            "type": f"{trade['type']}_position",
+            "id": f"trade_{i}",
+            "ticker": "BTCUSDT",
+            "startTime": trade["entry_time"],
+            "endTime": trade["exit_time"],
+            "entryPrice": trade["entry_price"],
+            "targetPrice": trade["take_profit"],
+            "stopPrice": trade["stop_loss"],
+        }
+
+
+def test_process_trades_without_levels_uses_default_brackets(trades_df):
+    trades = select_trade_columns(trades_df.drop(columns=["TP", "SL"]))
+
+    trades_list = process_trades(trades, "ETHUSDT", {})[0]
+
+    # Defaults: stop_loss_pct=0.02, risk_reward=2
+    assert trades_list[0]["take_profit"] == pytest.approx(104.0)
+    assert trades_list[0]["stop_loss"] == pytest.approx(98.0)
+    assert trades_list[1]["take_profit"] == pytest.approx(192.0)
+    assert trades_list[1]["stop_loss"] == pytest.approx(204.0)
+    assert {trade["exit_reason"] for trade in trades_list} == {"stop_loss"}
+
+
+def test_process_trades_empty_frame(trades_df):
+    result = process_trades(select_trade_columns(trades_df.iloc[:0]), "BTCUSDT", {})
+
+    assert result[:6] == ([], [], 0, 0, 0, 0)
+    assert result[6].size == 0
+
+
+def test_calculate_trading_days(trades_df):
+    assert calculate_trading_days(trades_df) == 2
+    assert calculate_trading_days(trades_df.iloc[:0]) == 0
+
+
+@pytest.mark.parametrize("pnl", [
+    [5.0, -3.0, 2.0],  # n < 20: the index is 0, the worst trade
+    list(np.linspace(-50.0, 50.0, 40)),
+    list(np.random.default_rng(7).normal(size=101)),
+])
+def test_calculate_value_at_risk_matches_sorted_percentile(pnl):
+    expected = abs(sorted(pnl)[int(len(pnl) * 0.05)])
+
+    assert calculate_value_at_risk(np.array(pnl)) == expected
+
+
+def test_calculate_value_at_risk_empty():
+    assert calculate_value_at_risk(np.array([])) == 0.0